@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark SMM transports
+Compare the requests.Session path with the httpx client over HTTP/1.1 and HTTP/2
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+ENDPOINT = os.getenv("BENCH_ENDPOINT", "api/v1/admin/brokers")
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "32"))
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "5"))
+
+
+def build_bench_client(client_mode, http2=False):
+    """Build a client from the environment with caching and throttling disabled."""
+    from ssm_mcp_server.config import ServerConfig
+    from ssm_mcp_server.server import build_client
+
+    config = ServerConfig()
+    config.client_mode = client_mode
+    config.http2 = http2
+    config.cache_enabled = False
+    config.coalesce_gets = False
+    config.adaptive_concurrency = False
+    config.circuit_breaker = False
+    config.rate_limit_rps = 0
+    config.pool_maxsize = max(config.pool_maxsize, CONCURRENCY)
+    return build_client(config)
+
+
+def summarize(name, wall_times, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"   {name:<24} wall/round {statistics.mean(wall_times) * 1000:8.1f} ms   "
+          f"p50 {statistics.median(latencies) * 1000:7.1f} ms   p95 {p95 * 1000:7.1f} ms")
+
+
+def bench_requests():
+    client = build_bench_client("sync")
+
+    def timed_get(_):
+        started = time.perf_counter()
+        client._fetch(ENDPOINT)
+        return time.perf_counter() - started
+
+    wall_times, latencies = [], []
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        list(pool.map(timed_get, range(CONCURRENCY)))  # warm up connections
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            latencies.extend(pool.map(timed_get, range(CONCURRENCY)))
+            wall_times.append(time.perf_counter() - started)
+    summarize("requests.Session", wall_times, latencies)
+
+
+async def bench_httpx(http2):
+    client = build_bench_client("async", http2=http2)
+
+    async def timed_get():
+        started = time.perf_counter()
+        await client._fetch(ENDPOINT)
+        return time.perf_counter() - started
+
+    wall_times, latencies = [], []
+    try:
+        await asyncio.gather(*(timed_get() for _ in range(CONCURRENCY)))
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            latencies.extend(await asyncio.gather(*(timed_get() for _ in range(CONCURRENCY))))
+            wall_times.append(time.perf_counter() - started)
+        connections = len(client._client()._transport._pool.connections)
+    finally:
+        await client.aclose()
+    name = "httpx HTTP/2" if http2 else "httpx HTTP/1.1"
+    summarize(name, wall_times, latencies)
+    print(f"   {'':<24} open connections after run: {connections}")
+
+
+def main():
+    print("🏁 SMM Transport Benchmark")
+    print("=" * 60)
+    print(f"Endpoint: {ENDPOINT}")
+    print(f"Concurrency: {CONCURRENCY} requests per round, {ROUNDS} rounds")
+    print()
+
+    try:
+        bench_requests()
+        asyncio.run(bench_httpx(http2=False))
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            print("   ⚠️  HTTP/2 skipped: install with pip install 'ssm-mcp-server[http2]'")
+        else:
+            asyncio.run(bench_httpx(http2=True))
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    print()
+    print("✅ Benchmark complete")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
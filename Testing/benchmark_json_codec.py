@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON codecs
+Time decoding SMM response bodies and encoding tool results with each installed codec
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+# Comma-separated JSON files recorded from SMM, e.g. with
+#   curl -u user:pass https://smm-host/api/v1/admin/topics > admin_topics.json
+PAYLOADS = os.getenv("BENCH_PAYLOADS", "")
+TOPICS = int(os.getenv("BENCH_TOPICS", "2000"))
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "20"))
+
+
+def synthetic_admin_topics(count):
+    """A body shaped like api/v1/admin/topics for clusters without recordings."""
+    return json.dumps([
+        {
+            "name": f"orders.events.{i}",
+            "internal": False,
+            "partitions": [
+                {
+                    "partition": p,
+                    "leader": {"id": p % 3, "host": f"broker-{p % 3}.example.com", "port": 9093},
+                    "replicas": [{"id": r, "host": f"broker-{r}.example.com", "port": 9093} for r in range(3)],
+                    "isr": [{"id": r, "host": f"broker-{r}.example.com", "port": 9093} for r in range(3)],
+                }
+                for p in range(6)
+            ],
+            "configs": {"retention.ms": "604800000", "cleanup.policy": "delete", "min.insync.replicas": "2"},
+        }
+        for i in range(count)
+    ]).encode()
+
+
+def load_payloads():
+    if not PAYLOADS:
+        return {f"synthetic admin/topics ({TOPICS} topics)": synthetic_admin_topics(TOPICS)}
+    return {path: Path(path).read_bytes() for path in PAYLOADS.split(",") if path.strip()}
+
+
+def best_of(fn):
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), statistics.median(timings)
+
+
+def report(name, timings):
+    fastest, median = timings
+    print(f"   {name:<28} best {fastest * 1000:8.2f} ms   median {median * 1000:8.2f} ms")
+
+
+def main():
+    from ssm_mcp_server.codec import resolve_codec
+
+    print("🏁 SMM JSON Codec Benchmark")
+    print("=" * 60)
+
+    codecs = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codecs.append(resolve_codec(name))
+        except RuntimeError:
+            print(f"   ⚠️  {name} not installed, skipped")
+
+    try:
+        import pydantic_core
+    except ImportError:
+        pydantic_core = None
+
+    for label, body in load_payloads().items():
+        document = json.loads(body)
+        print()
+        print(f"📦 {label}: {len(body) / 1024:.0f} KiB")
+        print("  Decode (SMM response body)")
+        for codec in codecs:
+            report(codec.name, best_of(lambda: codec.loads(body)))
+        print("  Encode (MCP tool result)")
+        if pydantic_core is not None:
+            # What FastMCP does with a plain dict return value
+            report("FastMCP default (indent=2)", best_of(
+                lambda: pydantic_core.to_json(document, fallback=str, indent=2).decode()
+            ))
+        for codec in codecs:
+            report(codec.name, best_of(lambda: codec.dumps(document)))
+
+    print()
+    print("✅ Benchmark complete")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test cancellation recovery
+Cancel a burst of tool calls stuck on a slow SMM endpoint and check that worker
+threads and pooled connections are free again right away
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+BURST = int(os.getenv("CANCEL_BURST", "8"))
+SLOW_SECONDS = float(os.getenv("CANCEL_SLOW_SECONDS", "30"))
+# A fast call must complete within this long after the burst is cancelled
+RECOVERY_LIMIT = float(os.getenv("CANCEL_RECOVERY_LIMIT", "1.0"))
+
+
+class StubSMM(BaseHTTPRequestHandler):
+    """Answers api/v1/admin/slow after SLOW_SECONDS and everything else at once."""
+
+    def do_GET(self):
+        if "slow" in self.path:
+            time.sleep(SLOW_SECONDS)
+        body = json.dumps({"path": self.path}).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass  # the client hung up on a cancelled call
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSMM)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def pool_settings():
+    from ssm_mcp_server.transport import PoolSettings
+
+    # As many connections as workers, and calls wait for a free one
+    return PoolSettings(maxsize=BURST, block=True)
+
+
+async def burst_then_fast(label, call, slow, fast):
+    tasks = [asyncio.ensure_future(call(slow)) for _ in range(BURST)]
+    await asyncio.sleep(0.5)  # let every call reach the stub
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    started = time.monotonic()
+    await asyncio.wait_for(call(fast), timeout=SLOW_SECONDS)
+    took = time.monotonic() - started
+    ok = took < RECOVERY_LIMIT
+    print(f"   {'✅' if ok else '❌'} {label}: fast call after cancelling {BURST} slow ones "
+          f"took {took * 1000:.0f} ms")
+    return ok
+
+
+async def check_threaded(base_url):
+    from ssm_mcp_server.client import SMMClient
+    from ssm_mcp_server.executor import WorkerPool
+    from ssm_mcp_server.transport import configure_session
+
+    session = configure_session(requests.Session(), pool_settings())
+    client = SMMClient(base_url, session, timeout_seconds=SLOW_SECONDS * 2)
+    # Exactly BURST workers: without cancellation every one stays busy
+    worker_pool = WorkerPool(max_workers=BURST)
+
+    async def call(path):
+        return await worker_pool.run(client._fetch, path)
+
+    try:
+        ok = await burst_then_fast("threaded client", call, "api/v1/admin/slow", "api/v1/admin/fast")
+        stats = worker_pool.stats()
+        print(f"      worker pool: active {stats['active']}, cancelled {stats['cancelled']}")
+        return ok
+    finally:
+        worker_pool.shutdown()
+
+
+async def check_coalesced_follower(base_url):
+    from ssm_mcp_server.client import SMMClient
+    from ssm_mcp_server.executor import WorkerPool
+    from ssm_mcp_server.singleflight import SingleFlight
+    from ssm_mcp_server.transport import configure_session
+
+    session = configure_session(requests.Session(), pool_settings())
+    client = SMMClient(
+        base_url, session, timeout_seconds=SLOW_SECONDS * 2, single_flight=SingleFlight()
+    )
+    # Two workers: the leader keeps one, the cancelled follower must free the other
+    worker_pool = WorkerPool(max_workers=2)
+    leader = asyncio.ensure_future(worker_pool.run(client._get, "api/v1/admin/slow"))
+    await asyncio.sleep(0.2)
+    follower = asyncio.ensure_future(worker_pool.run(client._get, "api/v1/admin/slow"))
+    await asyncio.sleep(0.2)
+    follower.cancel()
+    await asyncio.gather(follower, return_exceptions=True)
+    started = time.monotonic()
+    try:
+        await asyncio.wait_for(
+            worker_pool.run(client._fetch, "api/v1/admin/fast"), timeout=SLOW_SECONDS
+        )
+        took = time.monotonic() - started
+        ok = took < RECOVERY_LIMIT
+        print(f"   {'✅' if ok else '❌'} coalesced follower: fast call after cancelling "
+              f"it took {took * 1000:.0f} ms")
+        return ok
+    finally:
+        leader.cancel()
+        await asyncio.gather(leader, return_exceptions=True)
+        worker_pool.shutdown()
+
+
+async def check_async(base_url):
+    from ssm_mcp_server.async_client import AsyncSMMClient
+    from ssm_mcp_server.singleflight import SingleFlight
+
+    client = AsyncSMMClient(
+        base_url,
+        requests.Session(),
+        timeout_seconds=SLOW_SECONDS * 2,
+        single_flight=SingleFlight(),
+        pool=pool_settings(),
+    )
+    try:
+        # Coalesced callers all cancelled: the shared request must stop too
+        return await burst_then_fast(
+            "async client", client._get, "api/v1/admin/slow", "api/v1/admin/fast"
+        )
+    finally:
+        await client.aclose()
+
+
+def main():
+    print("🧪 SMM Cancellation Recovery Test")
+    print("=" * 60)
+    print(f"Burst: {BURST} calls to an endpoint answering after {SLOW_SECONDS:.0f}s")
+    print()
+
+    server, base_url = start_stub()
+    try:
+        results = [
+            asyncio.run(check_threaded(base_url)),
+            asyncio.run(check_coalesced_follower(base_url)),
+            asyncio.run(check_async(base_url)),
+        ]
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        return 1
+    finally:
+        server.shutdown()
+
+    print()
+    if all(results):
+        print("✅ Capacity recovered immediately after cancellation")
+        return 0
+    print("❌ Cancelled calls kept holding capacity")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test circuit breaker 404 handling
+"Not found" answers for single resources (a topic without a schema, an unknown
+consumer group) must not open the circuit shared by their endpoint family,
+while 404s from endpoints the cluster doesn't serve still must
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+
+def answer(breaker, path, status):
+    template = breaker.before(path)
+    breaker.record_response(template, SimpleNamespace(status_code=status), path)
+
+
+def opens(breaker, path):
+    from ssm_mcp_server.circuit import CircuitOpenError
+
+    try:
+        breaker.before(path)
+    except CircuitOpenError:
+        return True
+    return False
+
+
+def check(label, ok):
+    print(f"   {'✅' if ok else '❌'} {label}")
+    return ok
+
+
+def default_breaker():
+    from ssm_mcp_server.circuit import CircuitBreaker
+    from ssm_mcp_server.config import ServerConfig
+
+    config = ServerConfig()
+    return CircuitBreaker.from_config(
+        config.circuit_templates_csv,
+        5,
+        30.0,
+        config.circuit_resource_paths_csv,
+    )
+
+
+def unsupported(path, other):
+    """Whether 5 404s from ``path`` open its circuit, checked via ``other``."""
+    breaker = default_breaker()
+    for _ in range(5):
+        answer(breaker, path, 404)
+    return check(f"404s from {path} open its circuit", opens(breaker, other))
+
+
+def main():
+    from ssm_mcp_server.circuit import CircuitBreaker
+
+    print("🧪 SMM Circuit Breaker 404 Test")
+    print("=" * 60)
+
+    results = []
+
+    breaker = default_breaker()
+    for i in range(10):
+        answer(breaker, f"schemaRegistry/schemaMetaForTopic/no-schema-{i}", 404)
+    results.append(check(
+        "404s for topics without a schema leave schemaRegistry/* closed",
+        not opens(breaker, "schemaRegistry/schemaMetaForTopic/orders"),
+    ))
+
+    breaker = default_breaker()
+    for i in range(10):
+        answer(breaker, f"consumerGroupRelatedDetails/consumerGroupInfo/gone-{i}", 404)
+    results.append(check(
+        "404s for unknown consumer groups leave consumerGroupRelatedDetails/* closed",
+        not opens(breaker, "consumerGroupRelatedDetails/consumerGroupInfo/orders"),
+    ))
+
+    breaker = default_breaker()
+    for i in range(5):
+        answer(breaker, f"schemaRegistry/schemaMetaForTopic/topic-{i}", 503)
+    results.append(check(
+        "5xx from the same family still opens it",
+        opens(breaker, "schemaRegistry/schemaMetaForTopic/orders"),
+    ))
+
+    # Endpoint families this SMM version doesn't serve
+    for path, other in [
+        ("api/v1/admin/metrics/cluster", "api/v1/admin/metrics/topics"),
+        ("alertPolicyOperations/allAlertPolicies", "alertPolicyOperations/alertPolicy/7"),
+        ("schemaRegistry/schemaRegistryInfo", "schemaRegistry/schemas"),
+        ("api/v1/admin/health/system", "api/v1/admin/health/brokers"),
+        ("lineage/topicLineage/x", "lineage/consumerGroupLineage/g"),
+        ("lineage/", "lineage/topicLineage/orders"),
+    ]:
+        results.append(unsupported(path, other))
+
+    breaker = CircuitBreaker([], failure_threshold=5)
+    for _ in range(5):
+        answer(breaker, "api/v1/admin/alerts", 404)
+    results.append(check(
+        "404 from an untemplated endpoint opens its own circuit",
+        opens(breaker, "api/v1/admin/alerts")
+        and not opens(breaker, "api/v1/admin/brokers"),
+    ))
+
+    print()
+    if all(results):
+        print("✅ Circuit breaker handles 404s per resource")
+        return 0
+    print("❌ Circuit breaker 404 handling is wrong")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Test deadlines while throttled
+Calls queued behind the rate limiter or the concurrency limiter must give up
+at their deadline instead of waiting out the limiter, and a coalesced call
+must run to its own deadline, not the leader's
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+DEADLINE_SECONDS = float(os.getenv("LIMIT_DEADLINE_SECONDS", "2"))
+CALLS = int(os.getenv("LIMIT_CALLS", "5"))
+# Slack allowed past the deadline before a call counts as overrunning it
+SLACK = 0.3
+
+
+class StubSMM(BaseHTTPRequestHandler):
+    """Answers api/v1/admin/slow after 3x the deadline and everything else at once."""
+
+    def do_GET(self):
+        if "slow" in self.path:
+            time.sleep(DEADLINE_SECONDS * 3)
+        body = json.dumps({"path": self.path}).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSMM)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def build(client_cls, base_url, **options):
+    from ssm_mcp_server.transport import PoolSettings, configure_session
+
+    session = configure_session(requests.Session(), PoolSettings())
+    return client_cls(base_url, session, **options)
+
+
+def outcome(started, error):
+    took = time.monotonic() - started
+    return took, type(error).__name__ if error else "ok"
+
+
+def timed_sync(call, seconds=DEADLINE_SECONDS):
+    from ssm_mcp_server.deadline import DEADLINE
+
+    def run():
+        started = time.monotonic()
+        DEADLINE.set(started + seconds)
+        try:
+            call()
+        except Exception as e:
+            return outcome(started, e)
+        return outcome(started, None)
+
+    # Pool threads are reused; keep each call's deadline to itself
+    return contextvars.Context().run(run)
+
+
+async def timed_async(call, seconds=DEADLINE_SECONDS):
+    from ssm_mcp_server.deadline import DEADLINE
+
+    started = time.monotonic()
+    DEADLINE.set(started + seconds)
+    try:
+        await call()
+    except Exception as e:
+        return outcome(started, e)
+    return outcome(started, None)
+
+
+def report(label, results):
+    worst = max(took for took, _ in results)
+    ok = worst <= DEADLINE_SECONDS + SLACK
+    summary = ", ".join(f"{took:.2f}s {name}" for took, name in sorted(results))
+    print(f"   {'✅' if ok else '❌'} {label}: {summary}")
+    return ok
+
+
+def check_rate_limiter(base_url):
+    from ssm_mcp_server.async_client import AsyncSMMClient
+    from ssm_mcp_server.client import SMMClient
+    from ssm_mcp_server.ratelimit import RateLimiter
+
+    # 0.5 rps: the fifth call's token is 8 s away
+    sync_client = build(SMMClient, base_url, rate_limiter=RateLimiter(0.5, 1))
+    with ThreadPoolExecutor(max_workers=CALLS) as pool:
+        threaded = list(pool.map(
+            lambda _: timed_sync(lambda: sync_client._fetch("api/v1/admin/fast")),
+            range(CALLS),
+        ))
+
+    async def run_async():
+        client = build(AsyncSMMClient, base_url, rate_limiter=RateLimiter(0.5, 1))
+        try:
+            return await asyncio.gather(*(
+                timed_async(lambda: client._fetch("api/v1/admin/fast")) for _ in range(CALLS)
+            ))
+        finally:
+            await client.aclose()
+
+    return [
+        report("rate limiter, threaded", threaded),
+        report("rate limiter, async", asyncio.run(run_async())),
+    ]
+
+
+def check_concurrency_limiter(base_url):
+    from ssm_mcp_server.async_client import AsyncSMMClient
+    from ssm_mcp_server.client import SMMClient
+    from ssm_mcp_server.concurrency import AdaptiveLimiter
+
+    def limiter():
+        # One slot, held by a call to the slow endpoint
+        return AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1)
+
+    sync_client = build(SMMClient, base_url, concurrency_limiter=limiter())
+    with ThreadPoolExecutor(max_workers=CALLS + 1) as pool:
+        # The holder has no deadline of its own
+        pool.submit(sync_client._fetch, "api/v1/admin/slow")
+        time.sleep(0.2)
+        threaded = list(pool.map(
+            lambda _: timed_sync(lambda: sync_client._fetch("api/v1/admin/fast")),
+            range(CALLS),
+        ))
+
+    async def run_async():
+        client = build(AsyncSMMClient, base_url, concurrency_limiter=limiter())
+        try:
+            holder = asyncio.get_running_loop().create_task(
+                client._fetch("api/v1/admin/slow"), context=contextvars.Context()
+            )
+            await asyncio.sleep(0.2)
+            results = await asyncio.gather(*(
+                timed_async(lambda: client._fetch("api/v1/admin/fast")) for _ in range(CALLS)
+            ))
+            holder.cancel()
+            await asyncio.gather(holder, return_exceptions=True)
+            return results
+        finally:
+            await client.aclose()
+
+    return [
+        report("concurrency limiter, threaded", threaded),
+        report("concurrency limiter, async", asyncio.run(run_async())),
+    ]
+
+
+def report_mixed(label, leader, follower):
+    # The leader gives up at its deadline; the follower still gets the answer
+    ok = leader[0] <= DEADLINE_SECONDS + SLACK and follower[1] == "ok"
+    print(f"   {'✅' if ok else '❌'} {label}: leader {leader[0]:.2f}s {leader[1]}, "
+          f"follower {follower[0]:.2f}s {follower[1]}")
+    return ok
+
+
+def check_coalesced_deadlines(base_url):
+    from ssm_mcp_server.async_client import AsyncSMMClient
+    from ssm_mcp_server.client import SMMClient
+    from ssm_mcp_server.singleflight import SingleFlight
+
+    # The slow endpoint answers after 3x the leader's deadline, within the follower's
+    follower_seconds = DEADLINE_SECONDS * 5
+    sync_client = build(SMMClient, base_url, single_flight=SingleFlight())
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(timed_sync, lambda: sync_client._get("api/v1/admin/slow"))
+        time.sleep(0.2)
+        follower = pool.submit(
+            timed_sync, lambda: sync_client._get("api/v1/admin/slow"), follower_seconds
+        )
+        threaded = report_mixed(
+            "coalesced deadlines, threaded", leader.result(), follower.result()
+        )
+
+    async def run_async():
+        client = build(AsyncSMMClient, base_url, single_flight=SingleFlight())
+        try:
+            leader = asyncio.ensure_future(
+                timed_async(lambda: client._get("api/v1/admin/slow"))
+            )
+            await asyncio.sleep(0.2)
+            follower = await timed_async(
+                lambda: client._get("api/v1/admin/slow"), follower_seconds
+            )
+            return report_mixed("coalesced deadlines, async", await leader, follower)
+        finally:
+            await client.aclose()
+
+    return [threaded, asyncio.run(run_async())]
+
+
+def main():
+    print("🧪 SMM Deadline vs Limiter Test")
+    print("=" * 60)
+    print(f"{CALLS} concurrent calls with a {DEADLINE_SECONDS:.1f}s deadline each")
+    print()
+
+    server, base_url = start_stub()
+    try:
+        results = (
+            check_rate_limiter(base_url)
+            + check_concurrency_limiter(base_url)
+            + check_coalesced_deadlines(base_url)
+        )
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        return 1
+    finally:
+        server.shutdown()
+
+    print()
+    if all(results):
+        print("✅ No call waited on a limiter past its deadline")
+        return 0
+    print("❌ Some calls overran their deadline")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
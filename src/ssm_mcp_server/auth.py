@@ -1,10 +1,126 @@
 from __future__ import annotations
 
 import base64
-from typing import Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
 
 import requests
 
+from .singleflight import SingleFlight
+from .token_cache import TokenCache, cache_key, jwt_expiry
+from .transport import PoolSettings, configure_session
+
+
+class KnoxTokenRefresher:
+    """Renews a minted Knox JWT in the background before it expires.
+
+    A daemon thread sleeps until ``margin`` seconds before the token's
+    ``exp`` (halfway, for tokens living less than twice that) and then
+    mints a new one, so tool calls never wait on Knox.
+    Concurrent refreshes share a single token request. Tokens without an
+    ``exp`` claim are kept as they are. A failed mint, or a new token that is
+    already due, is retried after ``retry_seconds``.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        mint: Callable[[], str],
+        token: str,
+        margin: float = 300.0,
+        retry_seconds: float = 30.0,
+    ):
+        self.session = session
+        self.margin = margin
+        self.retry_seconds = retry_seconds
+        self._mint = mint
+        self._flight = SingleFlight()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._refreshes = 0
+        self._failures = 0
+        self._rejections = 0
+        self._install(token)
+
+    def _install(self, token: str) -> None:
+        self.token = token
+        self.expires_at = jwt_expiry(token)
+        self.refresh_at = None
+        if self.expires_at is not None:
+            # Short-lived tokens are renewed halfway through instead
+            lifetime = self.expires_at - time.time()
+            self.refresh_at = self.expires_at - min(self.margin, max(lifetime, 0.0) / 2)
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def refresh(self) -> str:
+        """Mint and install a new token; concurrent callers share one request."""
+        return self._flight.do("knox-token", self._refresh)
+
+    def replace(self, rejected: Optional[str]) -> str:
+        """Mint a new token after SMM answered 401 to ``rejected``.
+
+        Requests that raced the replacement of the same token reuse it
+        instead of minting another one.
+        """
+        self._rejections += 1
+        if rejected is not None and rejected != self.token:
+            return self.token
+        return self.refresh()
+
+    def _refresh(self) -> str:
+        try:
+            token = self._mint()
+        except Exception:
+            self._failures += 1
+            raise
+        self._install(token)
+        self._refreshes += 1
+        return token
+
+    def seconds_until_refresh(self) -> Optional[float]:
+        if self.refresh_at is None:
+            return None
+        return self.refresh_at - time.time()
+
+    def start(self) -> None:
+        if self._thread is None and self.expires_at is not None:
+            self._thread = threading.Thread(
+                target=self._run, name="knox-token-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            wait = self.seconds_until_refresh()
+            if wait is None or self._stop.wait(max(0.0, wait)):
+                return
+            try:
+                self.refresh()
+            except Exception:
+                # Keep the current token and try again shortly
+                self._stop.wait(self.retry_seconds)
+                continue
+            wait = self.seconds_until_refresh()
+            if wait is not None and wait <= 0:
+                # Knox handed out a token already due (e.g. clock skew); don't spin
+                self._failures += 1
+                self._stop.wait(self.retry_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        left = None
+        if self.expires_at is not None:
+            left = round(self.expires_at - time.time(), 1)
+        return {
+            "expires_in_seconds": left,
+            "refreshes": self._refreshes,
+            "refresh_failures": self._failures,
+            "rejected_by_smm": self._rejections,
+        }
+
 
 class KnoxAuthFactory:
     def __init__(
@@ -17,6 +133,10 @@ class KnoxAuthFactory:
         token_endpoint: Optional[str],
         passcode_token: Optional[str],
         verify: bool | str,
+        pool: Optional[PoolSettings] = None,
+        connect_timeout: float = 15,
+        refresh_margin: float = 300.0,
+        token_cache: Optional[TokenCache] = None,
     ):
         self.gateway_url = gateway_url.rstrip("/") if gateway_url else ""
         self.token = token
@@ -26,9 +146,16 @@ class KnoxAuthFactory:
         self.token_endpoint = token_endpoint
         self.passcode_token = passcode_token
         self.verify = verify
+        self.pool = pool or PoolSettings()
+        self.connect_timeout = connect_timeout
+        # Seconds before expiry a minted JWT is renewed; 0 disables renewal
+        self.refresh_margin = refresh_margin
+        self.refresher: Optional[KnoxTokenRefresher] = None
+        # Tokens shared with other server processes (KNOX_TOKEN_CACHE_PATH)
+        self.token_cache = token_cache
 
     def build_session(self) -> requests.Session:
-        session = requests.Session()
+        session = configure_session(requests.Session(), self.pool)
         session.verify = self.verify
 
         # Priority: Explicit Cookie -> Knox token (as cookie for CDP) -> Passcode token -> Basic creds token exchange
@@ -44,17 +171,13 @@ class KnoxAuthFactory:
         if self.passcode_token:
             # Prefer exchanging passcode for JWT via knoxtoken endpoint when available
             if self.token_endpoint:
-                jwt = self._exchange_passcode_for_jwt()
-                session.headers["Authorization"] = f"Bearer {jwt}"
-                return session
+                return self._use_minted_token(session, self._exchange_passcode_for_jwt)
             # Fallback: send passcode as header (may not work on all deployments)
             session.headers["X-Knox-Passcode"] = self.passcode_token
             return session
 
         if self.user and self.password and self.token_endpoint:
-            jwt = self._fetch_knox_token()
-            session.headers["Authorization"] = f"Bearer {jwt}"
-            return session
+            return self._use_minted_token(session, self._fetch_knox_token)
 
         # Fallback: Use basic authentication directly
         if self.user and self.password:
@@ -63,13 +186,37 @@ class KnoxAuthFactory:
 
         return session
 
+    def _use_minted_token(
+        self, session: requests.Session, mint: Callable[[], str]
+    ) -> requests.Session:
+        """Send a JWT minted by ``mint`` as Bearer token, renewing it before expiry."""
+        if self.token_cache is not None:
+            mint = self._shared_mint(mint)
+        self.refresher = KnoxTokenRefresher(
+            session, mint, mint(), margin=self.refresh_margin
+        )
+        if self.refresh_margin > 0:
+            self.refresher.start()
+        return session
+
+    def _shared_mint(self, mint: Callable[[], str]) -> Callable[[], str]:
+        """Wrap ``mint`` to reuse a token another process already cached."""
+        key = cache_key(self.gateway_url, self.user, self.passcode_token)
+
+        def _mint() -> str:
+            # Our own token is being replaced: don't hand it back from the cache
+            current = self.refresher.token if self.refresher is not None else None
+            return self.token_cache.get_or_mint(key, mint, stale=current)
+
+        return _mint
+
     def _fetch_knox_token(self) -> str:
         # Default Knox token endpoint returns raw JWT or JSON with token fields
         resp = requests.get(
             self.token_endpoint,
             auth=(self.user, self.password),
             verify=self.verify,
-            timeout=15,
+            timeout=(self.connect_timeout, 15),
         )
         resp.raise_for_status()
         try:
@@ -102,7 +249,7 @@ class KnoxAuthFactory:
             "X-Requested-By": "ssm-mcp-server",
         }
         resp = requests.get(
-            self.token_endpoint, headers=header, verify=self.verify, timeout=15
+            self.token_endpoint, headers=header, verify=self.verify, timeout=(self.connect_timeout, 15)
         )
         resp.raise_for_status()
         try:
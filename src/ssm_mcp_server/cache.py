@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+# Set by tools that need data straight from SMM; the response still refreshes the cache
+BYPASS_CACHE: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "smm_bypass_cache", default=False
+)
+
+
+class DataAge:
+    """Oldest data age observed while serving one tool call."""
+
+    def __init__(self) -> None:
+        self.seconds: Optional[float] = None
+
+    def observe(self, age: float) -> None:
+        if self.seconds is None or age > self.seconds:
+            self.seconds = age
+
+
+DATA_AGE: contextvars.ContextVar[Optional[DataAge]] = contextvars.ContextVar(
+    "smm_data_age", default=None
+)
+
+
+def observe_data_age(age: float) -> None:
+    tracker = DATA_AGE.get()
+    if tracker is not None:
+        tracker.observe(age)
+
+
+class CacheHit(NamedTuple):
+    value: Any
+    age: float
+    stale: bool
+
+
+def _approx_size(value: Any) -> int:
+    """Encoded size of ``value``; only for values not decoded from a body we hold."""
+    try:
+        return len(json.dumps(value, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class _Entry:
+    __slots__ = ("value", "size", "stored_at", "expires_at", "stale_until")
+
+    def __init__(
+        self,
+        value: Any,
+        size: int,
+        stored_at: float,
+        expires_at: float,
+        stale_until: float,
+    ):
+        self.value = value
+        self.size = size
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+    """Bounded TTL + LRU cache for decoded SMM GET responses.
+
+    TTLs are chosen per endpoint by the first matching glob rule (e.g.
+    ``admin/metrics/*``); a TTL of 0 disables caching for that endpoint.
+    Endpoints with a stale-while-revalidate rule keep serving an expired
+    entry for up to that many extra seconds while the caller refreshes it
+    in the background (driven by the client). Cached objects are shared between callers and must
+    be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 15.0,
+        ttl_rules: Optional[List[Tuple[str, float]]] = None,
+        stale_rules: Optional[List[Tuple[str, float]]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttl_rules = ttl_rules or []
+        self.stale_rules = stale_rules or []
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        max_entries: int,
+        max_bytes: int,
+        default_ttl: float,
+        ttls_csv: str,
+        stale_csv: str = "",
+    ) -> "ResponseCache":
+        """Build from SMM_CACHE_* settings, e.g. ``admin/metrics/*=5,kafka-connect/*=3600``."""
+        return cls(
+            max_entries,
+            max_bytes,
+            default_ttl,
+            parse_rules(ttls_csv),
+            parse_rules(stale_csv),
+        )
+
+    def ttl_for(self, path: str) -> float:
+        return match_rule(self.ttl_rules, path, self.default_ttl)
+
+    def max_stale_for(self, path: str) -> float:
+        return match_rule(self.stale_rules, path, 0.0)
+
+    def lookup(self, key: Hashable) -> Optional[CacheHit]:
+        """Return a fresh or servable-stale entry, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is None or entry.stale_until <= now:
+                if entry is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            stale = entry.expires_at <= now
+            if stale:
+                self._stale_hits += 1
+            else:
+                self._hits += 1
+            return CacheHit(entry.value, now - entry.stored_at, stale)
+
+    def put(
+        self, key: Hashable, path: str, value: Any, size: Optional[int] = None
+    ) -> None:
+        """Cache ``value``, charged ``size`` bytes (the response body it came from)."""
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return
+        if size is None:
+            size = _approx_size(value)
+        if size > self.max_bytes:
+            return
+        now = time.monotonic()
+        expires_at = now + ttl
+        stale_until = expires_at + self.max_stale_for(path)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, size, now, expires_at, stale_until)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, patterns: List[str]) -> int:
+        """Evict entries whose request path matches any of the glob patterns."""
+        with self._lock:
+            doomed = [
+                key
+                for key in self._entries
+                if any(fnmatchcase(str(key[0]), pattern) for pattern in patterns)
+            ]
+            for key in doomed:
+                self._remove(key)
+            self._invalidations += len(doomed)
+            return len(doomed)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+def parse_rules(csv: str) -> List[Tuple[str, float]]:
+    rules: List[Tuple[str, float]] = []
+    for item in csv.split(","):
+        if "=" not in item:
+            continue
+        pattern, _, seconds = item.rpartition("=")
+        rules.append((pattern.strip().lstrip("/"), float(seconds)))
+    return rules
+
+
+def match_rule(rules: List[Tuple[str, float]], path: str, default: float) -> float:
+    path = path.lstrip("/")
+    for pattern, seconds in rules:
+        if fnmatchcase(path, pattern):
+            return seconds
+    return default
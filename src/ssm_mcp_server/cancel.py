@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Optional, Set
+
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class CallCancelled(Exception):
+    """Raised in a worker thread once the tool call it serves was cancelled."""
+
+    def __init__(self) -> None:
+        super().__init__("Tool call was cancelled")
+
+
+class CancelToken:
+    """Cancellation signal for one tool call running on a worker thread.
+
+    A blocking ``requests`` call can't be interrupted from outside, so the
+    pooled connections the call is using register here. Cancelling shuts
+    their sockets down: the blocked read fails at once, and the worker
+    thread and the connection's pool slot are released immediately.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._connections: Set[Any] = set()
+        self._children: Set["CancelToken"] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._event.set()
+            connections, self._connections = self._connections, set()
+            children, self._children = self._children, set()
+        for conn in connections:
+            _shutdown(conn)
+        for child in children:
+            child.cancel()
+
+    def child(self) -> "CancelToken":
+        """A token cancelled along with this one that can also be cancelled alone."""
+        child = CancelToken()
+        with self._lock:
+            if not self._event.is_set():
+                self._children.add(child)
+                return child
+        child.cancel()
+        return child
+
+    def attach(self, conn: Any) -> None:
+        with self._lock:
+            if not self._event.is_set():
+                self._connections.add(conn)
+                return
+        raise CallCancelled()
+
+    def detach(self, conn: Any) -> None:
+        with self._lock:
+            self._connections.discard(conn)
+
+    def wait(self, seconds: float) -> bool:
+        """Sleep up to ``seconds``; True if cancelled meanwhile."""
+        return self._event.wait(seconds)
+
+
+# Token of the tool call the current thread is working for, if cancellable
+CANCEL_TOKEN: ContextVar[Optional[CancelToken]] = ContextVar("smm_cancel", default=None)
+
+
+def _shutdown(conn: Any) -> None:
+    sock = getattr(conn, "sock", None)
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+# Longest a cancellable thread blocks on a lock, condition or event at once
+WAIT_SLICE = 0.05
+
+
+def wait_slice(left: Optional[float]) -> Optional[float]:
+    """Timeout for one blocking wait: ``left``, short enough to notice cancellation."""
+    if CANCEL_TOKEN.get() is None:
+        return left
+    return WAIT_SLICE if left is None else min(left, WAIT_SLICE)
+
+
+def check_cancelled() -> None:
+    token = CANCEL_TOKEN.get()
+    if token is not None and token.cancelled:
+        raise CallCancelled()
+
+
+def cancellable_sleep(seconds: float) -> None:
+    """time.sleep that ends early, raising CallCancelled, if the call is cancelled."""
+    token = CANCEL_TOKEN.get()
+    if token is None:
+        time.sleep(seconds)
+    elif token.wait(seconds):
+        raise CallCancelled()
+
+
+class _TrackConnections:
+    """Registers connections with the current CancelToken while a call uses them."""
+
+    def _make_request(self, conn: Any, *args: Any, **kwargs: Any) -> Any:
+        token = CANCEL_TOKEN.get()
+        if token is not None:
+            token.attach(conn)
+            conn._smm_cancel_token = token
+        return super()._make_request(conn, *args, **kwargs)
+
+    def _put_conn(self, conn: Any) -> None:
+        # Back in the pool (body read or connection dropped): no longer ours to
+        # kill. The body may be released on another thread, so the token rides
+        # on the connection rather than being looked up from the context.
+        token = getattr(conn, "_smm_cancel_token", None)
+        if token is not None:
+            conn._smm_cancel_token = None
+            token.detach(conn)
+        super()._put_conn(conn)
+
+
+class CancellableHTTPConnectionPool(_TrackConnections, HTTPConnectionPool):
+    pass
+
+
+class CancellableHTTPSConnectionPool(_TrackConnections, HTTPSConnectionPool):
+    pass
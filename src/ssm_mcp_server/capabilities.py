@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .circuit import UNSUPPORTED_STATUSES
+
+
+class Probe(NamedTuple):
+    """One SMM capability: equivalent path variants, preferred first.
+
+    ``scope`` lists extra path globs that are only served when the
+    capability is, so they can be failed fast along with it.
+    """
+
+    name: str
+    variants: Tuple[str, ...]
+    scope: Tuple[str, ...] = ()
+
+
+# Endpoint set formerly probed by hand from Testing/discover_real_endpoints.py,
+# analyze_working_endpoints.py and explore_alternative_apis.py
+DEFAULT_PROBES: Tuple[Probe, ...] = (
+    Probe("brokers", ("api/v1/admin/brokers",)),
+    Probe("topic_configs", ("api/v1/admin/configs/topics", "configs/topics")),
+    Probe("admin_topics", ("api/v1/admin/topics",)),
+    Probe("admin_cluster", ("api/v1/admin/cluster",)),
+    Probe("default_topic_configs", ("api/v1/admin/configs/default/topics",)),
+    Probe("cluster_configs", ("api/v1/admin/configs/cluster", "api/v1/configs/cluster")),
+    Probe(
+        "consumers",
+        ("api/v1/admin/consumers", "api/v1/consumers", "api/v2/consumers"),
+        ("api/v1/admin/consumers/*",),
+    ),
+    Probe(
+        "consumer_group_details",
+        ("consumerGroupRelatedDetails/allConsumerInfo",),
+        ("consumerGroupRelatedDetails/*",),
+    ),
+    Probe(
+        "aggregated_metrics",
+        ("admin/metrics/aggregated/clusterWithBrokerMetrics",),
+        ("admin/metrics/aggregated/*",),
+    ),
+    Probe(
+        "cluster_metrics",
+        ("api/v1/admin/metrics/cluster", "api/v1/metrics/cluster", "api/v2/metrics/cluster"),
+    ),
+    Probe("consumer_metrics", ("api/v1/admin/metrics/consumers",)),
+    Probe(
+        "alert_policies",
+        ("alertPolicyOperations/allAlertPolicies",),
+        ("alertPolicyOperations/*",),
+    ),
+    Probe(
+        "alert_notifications",
+        ("api/v1/admin/alerts/notifications", "api/v1/alerts/notifications"),
+    ),
+    Probe("alert_history", ("api/v1/admin/alerts/history", "api/v1/alerts/history")),
+    Probe("alert_summary", ("api/v1/admin/alerts/summary",)),
+    Probe("notifiers", ("notifiers",), ("notifiers/*",)),
+    Probe(
+        "cluster_health",
+        ("api/v1/admin/health/cluster", "api/v1/health/cluster", "api/v2/health/cluster"),
+    ),
+    Probe("system_health", ("api/v1/admin/health/system",)),
+    Probe(
+        "schema_registry",
+        ("schemaRegistry/schemaRegistryInfo",),
+        ("schemaRegistry/*",),
+    ),
+    Probe(
+        "connectors",
+        ("api/v1/admin/connectors", "api/v1/connectors", "api/v2/connectors"),
+        ("api/v1/admin/connectors/*",),
+    ),
+    Probe("connector_templates", ("kafka-connect/connector-templates",)),
+    Probe("connect_configured", ("kafka-connect/is-configured",)),
+    Probe("connect_worker_metrics", ("metrics/connect/workers",)),
+    Probe("replication_configured", ("replication-stats/is-configured",)),
+    Probe("replication_stats", ("replication-stats",)),
+    Probe("access", ("authentication/access",)),
+)
+
+
+class EndpointUnsupportedError(RuntimeError):
+    """Raised instead of calling an endpoint the cluster is known not to serve."""
+
+    def __init__(self, path: str, capability: str, status: Optional[int]):
+        super().__init__(
+            f"{path} is not served by this SMM cluster "
+            f"(capability '{capability}' probed as HTTP {status})"
+        )
+        self.path = path
+        self.capability = capability
+        self.status = status
+
+
+def _supported(status: Optional[int]) -> Optional[bool]:
+    """True/False when a probe status is conclusive, None otherwise (auth, 5xx, errors)."""
+    if status is None:
+        return None
+    if 200 <= status < 300:
+        return True
+    if status in UNSUPPORTED_STATUSES:
+        return False
+    return None
+
+
+class CapabilityMap:
+    """Which SMM endpoints a cluster serves, and which path variant to use.
+
+    Probe results are raw HTTP statuses per path, kept per cluster in an
+    optional JSON file so restarts skip probing while the map is younger
+    than ``ttl_seconds``. Requests to a variant are rewritten to the
+    variant that answered; requests governed by a capability whose every
+    variant answered 404/405/501 fail immediately.
+    """
+
+    def __init__(
+        self,
+        cluster: str,
+        probes: Tuple[Probe, ...] = DEFAULT_PROBES,
+        store_path: Optional[str] = None,
+        ttl_seconds: float = 86400.0,
+    ):
+        self.cluster = cluster.rstrip("/")
+        self.probes = probes
+        self.store_path = os.path.expanduser(store_path) if store_path else None
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, Optional[int]] = {}
+        self._probed_at: Optional[float] = None
+        self._aliases: List[Tuple[str, str]] = []
+        self._unsupported: List[Tuple[str, Probe, Optional[int]]] = []
+        self._rejected = 0
+        self._load()
+
+    def probe_paths(self) -> List[str]:
+        return [path for probe in self.probes for path in probe.variants]
+
+    def is_fresh(self) -> bool:
+        return self._probed_at is not None and time.time() - self._probed_at < self.ttl_seconds
+
+    def install(self, statuses: Dict[str, Optional[int]]) -> None:
+        """Adopt a new set of probe results and persist them."""
+        with self._lock:
+            self._apply(statuses, time.time())
+        self._save()
+
+    def route(self, path: str) -> str:
+        """Return the path to request, or raise EndpointUnsupportedError."""
+        stripped = path.lstrip("/")
+        bare = stripped.split("?", 1)[0]
+        for variant, working in self._aliases:
+            if bare == variant or bare.startswith(variant + "/"):
+                return working + stripped[len(variant):]
+        for pattern, probe, status in self._unsupported:
+            if fnmatchcase(bare, pattern):
+                self._rejected += 1
+                raise EndpointUnsupportedError(bare, probe.name, status)
+        return path
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            capabilities = {}
+            for probe in self.probes:
+                results = {path: self._statuses.get(path) for path in probe.variants}
+                working = next(
+                    (p for p, s in results.items() if _supported(s)), None
+                )
+                verdicts = [_supported(s) for s in results.values()]
+                capabilities[probe.name] = {
+                    "supported": True
+                    if working
+                    else (False if verdicts and all(v is False for v in verdicts) else None),
+                    "path": working,
+                    "statuses": results,
+                }
+            return {
+                "cluster": self.cluster,
+                "probed_at": self._probed_at,
+                "supported": sorted(n for n, c in capabilities.items() if c["supported"]),
+                "unsupported": sorted(
+                    n for n, c in capabilities.items() if c["supported"] is False
+                ),
+                "capabilities": capabilities,
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "probed_at": self._probed_at,
+            "fresh": self.is_fresh(),
+            "rerouted_variants": len(self._aliases),
+            "unsupported_rules": len(self._unsupported),
+            "rejected": self._rejected,
+        }
+
+    def _apply(self, statuses: Dict[str, Optional[int]], probed_at: float) -> None:
+        aliases: List[Tuple[str, str]] = []
+        unsupported: List[Tuple[str, Probe, Optional[int]]] = []
+        for probe in self.probes:
+            verdicts = [_supported(statuses.get(path)) for path in probe.variants]
+            if True in verdicts:
+                working = probe.variants[verdicts.index(True)]
+                aliases.extend(
+                    (variant, working) for variant in probe.variants if variant != working
+                )
+            elif verdicts and all(v is False for v in verdicts):
+                status = statuses.get(probe.variants[0])
+                for pattern in probe.variants + probe.scope:
+                    unsupported.append((pattern, probe, status))
+        self._statuses = dict(statuses)
+        self._probed_at = probed_at
+        self._aliases = aliases
+        self._unsupported = unsupported
+
+    def _load(self) -> None:
+        if not self.store_path:
+            return
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                entry = json.load(f).get(self.cluster)
+        except (OSError, ValueError, AttributeError):
+            return
+        if not isinstance(entry, dict):
+            return
+        probed_at = entry.get("probed_at")
+        statuses = entry.get("statuses")
+        if not isinstance(probed_at, (int, float)) or not isinstance(statuses, dict):
+            return
+        if time.time() - probed_at >= self.ttl_seconds:
+            return
+        with self._lock:
+            self._apply(statuses, float(probed_at))
+
+    def _save(self) -> None:
+        if not self.store_path:
+            return
+        directory = os.path.dirname(self.store_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            try:
+                with open(self.store_path, "r", encoding="utf-8") as f:
+                    document = json.load(f)
+                if not isinstance(document, dict):
+                    document = {}
+            except (OSError, ValueError):
+                document = {}
+            document[self.cluster] = {
+                "probed_at": self._probed_at,
+                "statuses": self._statuses,
+            }
+            tmp_path = f"{self.store_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.store_path)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional
+
+
+class CatalogSnapshot:
+    """Immutable view of an SMM listing indexed by one key field."""
+
+    def __init__(self, items: Any, key_field: str, loaded_at: float):
+        self.source = items
+        self.loaded_at = loaded_at
+        self.by_key: Dict[Hashable, Dict[str, Any]] = {
+            item.get(key_field): item
+            for item in items
+            if isinstance(item, dict) and item.get(key_field) is not None
+        }
+        self._sorted_names: Optional[List[str]] = None
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+    def __len__(self) -> int:
+        return len(self.by_key)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        return self.by_key.get(key)
+
+    def with_prefix(self, prefix: str) -> List[str]:
+        # Built on first use; only name-keyed catalogs need the prefix index
+        if self._sorted_names is None:
+            self._sorted_names = sorted(str(key) for key in self.by_key)
+        names = self._sorted_names
+        start = bisect.bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
+
+
+class Catalog:
+    """Shared, periodically refreshed snapshot of one SMM listing endpoint.
+
+    The client loads ``path`` when the snapshot is older than ``ttl_seconds``
+    and swaps in a new snapshot atomically, so readers never see a half-built
+    index. A lookup miss triggers one forced reload if the snapshot is older
+    than ``miss_refresh_seconds`` so newly created resources are found.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key_field: str,
+        ttl_seconds: float = 30.0,
+        miss_refresh_seconds: float = 5.0,
+    ):
+        self.path = path
+        self.key_field = key_field
+        self.ttl_seconds = ttl_seconds
+        self.miss_refresh_seconds = miss_refresh_seconds
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+        self._refreshes = 0
+
+    def current(self) -> Optional[CatalogSnapshot]:
+        """Return the snapshot if it is still within its TTL."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.age >= self.ttl_seconds:
+            return None
+        return snapshot
+
+    def should_refresh_on_miss(self, snapshot: CatalogSnapshot) -> bool:
+        return snapshot.age >= self.miss_refresh_seconds
+
+    def install(self, items: Any) -> CatalogSnapshot:
+        with self._lock:
+            snapshot = self._snapshot
+            # A response served from the cache yields the same list object
+            if snapshot is not None and snapshot.source is items:
+                return snapshot
+            self._snapshot = CatalogSnapshot(items, self.key_field, time.monotonic())
+            self._refreshes += 1
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "entries": len(snapshot) if snapshot else 0,
+            "age_seconds": snapshot.age if snapshot else None,
+            "ttl_seconds": self.ttl_seconds,
+            "refreshes": self._refreshes,
+        }
+
+
+class TopicCatalog(Catalog):
+    """Topics from ``api/v1/admin/configs/topics`` keyed by ``resourceName``."""
+
+    def __init__(self, ttl_seconds: float = 30.0, miss_refresh_seconds: float = 5.0):
+        super().__init__(
+            "api/v1/admin/configs/topics",
+            "resourceName",
+            ttl_seconds=ttl_seconds,
+            miss_refresh_seconds=miss_refresh_seconds,
+        )
+
+
+class BrokerCatalog(Catalog):
+    """Brokers from ``api/v1/admin/brokers`` keyed by ``id``."""
+
+    def __init__(self, ttl_seconds: float = 60.0, miss_refresh_seconds: float = 5.0):
+        super().__init__(
+            "api/v1/admin/brokers",
+            "id",
+            ttl_seconds=ttl_seconds,
+            miss_refresh_seconds=miss_refresh_seconds,
+        )
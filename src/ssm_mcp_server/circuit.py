@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+import time
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional
+
+import httpx
+import requests
+
+# Answers meaning the cluster does not serve this endpoint at all
+UNSUPPORTED_STATUSES = frozenset({404, 405, 501})
+
+_TRANSPORT_ERRORS = (requests.ConnectionError, requests.Timeout, httpx.TransportError)
+
+# Untemplated paths get a circuit each; bound how many partial failure counts we keep
+_MAX_CIRCUITS = 1024
+
+
+def _globs(csv: str) -> List[str]:
+    return [g.strip().lstrip("/") for g in csv.split(",") if g.strip()]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+    def __init__(self, template: str, retry_in: float):
+        super().__init__(
+            f"Endpoint {template} is failing; skipping SMM for another {retry_in:.1f}s"
+        )
+        self.template = template
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_at", "probe_started")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_started: Optional[float] = None
+
+
+class CircuitBreaker:
+    """Fast-fail endpoints that keep failing, grouped by endpoint template.
+
+    A path is grouped under the first matching glob in ``templates`` (e.g.
+    ``api/v1/admin/metrics/*``), otherwise it forms its own group. After
+    ``failure_threshold`` consecutive failures (404/405/501, 5xx or a network
+    error) the circuit opens and calls fail at once. A 404 from a path
+    matching ``resource_paths`` (e.g. ``schemaRegistry/schemaMetaForTopic/*``)
+    means "no such topic/group/policy" and counts neither way. After
+    ``reset_seconds`` a single probe is let through; its success closes the
+    circuit, its failure reopens it. Auth errors and 429 count neither way.
+    """
+
+    def __init__(
+        self,
+        templates: Optional[List[str]] = None,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        resource_paths: Optional[List[str]] = None,
+    ):
+        self.templates = templates or []
+        self.resource_paths = resource_paths or []
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+        self._rejected = 0
+        self._trips = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        templates_csv: str,
+        failure_threshold: int,
+        reset_seconds: float,
+        resource_paths_csv: str = "",
+    ) -> "CircuitBreaker":
+        """Build from SMM_CIRCUIT_* settings, e.g. ``alertPolicy/*,lineage/*``."""
+        return cls(
+            _globs(templates_csv),
+            failure_threshold,
+            reset_seconds,
+            _globs(resource_paths_csv),
+        )
+
+    def template_for(self, path: str) -> str:
+        path = path.lstrip("/").split("?", 1)[0]
+        for template in self.templates:
+            if fnmatchcase(path, template):
+                return template
+        return path
+
+    def before(self, path: str) -> str:
+        """Admit a request to ``path`` or raise CircuitOpenError; returns its template."""
+        template = self.template_for(path)
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is None or circuit.opened_at is None:
+                return template
+            now = time.monotonic()
+            wait = circuit.opened_at + self.reset_seconds - now
+            # A probe whose caller vanished without reporting is replaced after a timeout
+            probing = (
+                circuit.probe_started is not None
+                and now - circuit.probe_started < self.reset_seconds
+            )
+            if wait > 0 or probing:
+                self._rejected += 1
+                raise CircuitOpenError(template, max(wait, 0.0) or self.reset_seconds)
+            circuit.probe_started = now
+            return template
+
+    def record_response(self, template: str, resp: Any, path: str = "") -> None:
+        status = resp.status_code
+        if status in (401, 403, 429):
+            self._record(template, None)
+        elif status == 404 and self._names_resource(path):
+            # "No such topic/group/policy": the endpoint itself answered fine
+            self._record(template, None)
+        else:
+            self._record(template, status >= 500 or status in UNSUPPORTED_STATUSES)
+
+    def _names_resource(self, path: str) -> bool:
+        path = path.lstrip("/").split("?", 1)[0]
+        return any(fnmatchcase(path, pattern) for pattern in self.resource_paths)
+
+    def record_error(self, template: str, error: BaseException) -> None:
+        self._record(template, True if isinstance(error, _TRANSPORT_ERRORS) else None)
+
+    def _record(self, template: str, failed: Optional[bool]) -> None:
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is None:
+                if not failed:
+                    return
+                if len(self._circuits) >= _MAX_CIRCUITS:
+                    self._forget_closed()
+                circuit = self._circuits[template] = _Circuit()
+            circuit.probe_started = None
+            if failed is None:
+                return
+            if not failed:
+                del self._circuits[template]
+                return
+            circuit.failures += 1
+            if circuit.opened_at is not None or circuit.failures >= self.failure_threshold:
+                if circuit.opened_at is None:
+                    self._trips += 1
+                circuit.opened_at = time.monotonic()
+
+    def _forget_closed(self) -> None:
+        for template in [t for t, c in self._circuits.items() if c.opened_at is None]:
+            del self._circuits[template]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "open": {
+                    template: {
+                        "consecutive_failures": circuit.failures,
+                        "retry_in_seconds": round(
+                            max(0.0, circuit.opened_at + self.reset_seconds - now), 1
+                        ),
+                    }
+                    for template, circuit in self._circuits.items()
+                    if circuit.opened_at is not None
+                },
+                "trips": self._trips,
+                "rejected": self._rejected,
+            }
@@ -1,32 +1,255 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, List
+import contextvars
+import functools
+import glob
+import inspect
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Optional, List, Set, Tuple
 
 import requests
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
+
+from .auth import KnoxTokenRefresher
+from .cache import BYPASS_CACHE, CacheHit, ResponseCache, observe_data_age
+from .cancel import CANCEL_TOKEN, CancelToken, cancellable_sleep, check_cancelled
+from .capabilities import CapabilityMap
+from .catalog import BrokerCatalog, Catalog, CatalogSnapshot, TopicCatalog
+from .circuit import CircuitBreaker
+from .codec import JsonCodec, resolve_codec
+from .concurrency import AdaptiveLimiter, OVERLOAD_STATUSES
+from .deadline import DeadlineExceeded, capped, check_deadline, fits, time_left
+from .disk_cache import DiskCache
+from .hedge import HedgePolicy, answered
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .schema_cache import SCHEMA_KINDS, SchemaVersionStore
+from .singleflight import SingleFlight, request_key
+from .streaming import fields_key, normalize_fields, project_document, stream_project
+
+
+# Threads running hedged GET copies; created on first use
+_HEDGE_THREADS = 64
 
 
 class SMMError(Exception):
     pass
 
 
+def invalidates(*patterns: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Declare the cached GET paths a write method makes stale.
+
+    Patterns are globs over request paths; ``{arg}`` placeholders are filled
+    from the call's arguments (once per element for list arguments). The
+    affected cache entries and catalogs are evicted once the write finishes,
+    whether or not it succeeded, since a failed call may still have applied.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self: "SMMClient", *args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(self, *args, **kwargs)
+            stale = _expand_patterns(patterns, bound.arguments)
+            try:
+                result = func(self, *args, **kwargs)
+            except BaseException:
+                self._invalidate(stale)
+                raise
+            if inspect.isawaitable(result):
+                return _invalidate_after(self, result, stale)
+            self._invalidate(stale)
+            return result
+
+        wrapper.invalidates = patterns
+        return wrapper
+
+    return decorator
+
+
+async def _invalidate_after(client: "SMMClient", pending: Any, stale: List[str]) -> Any:
+    try:
+        return await pending
+    finally:
+        await client._invalidate_async(stale)
+
+
+def _expand_patterns(patterns: Any, arguments: Dict[str, Any]) -> List[str]:
+    expanded: List[str] = []
+    for pattern in patterns:
+        names = [name for name in arguments if "{" + name + "}" in pattern]
+        variants = [pattern]
+        for name in names:
+            value = arguments[name]
+            values = value if isinstance(value, (list, tuple)) else [value]
+            variants = [
+                variant.replace("{" + name + "}", glob.escape(str(v)))
+                for variant in variants
+                for v in values
+            ]
+        expanded.extend(variants)
+    return expanded
+
+
+def _error_message(resp: Any, path: str) -> str:
+    """Extract the SMM error message from a failed response."""
+    try:
+        error_data = resp.json()
+        error_message = error_data.get(
+            "error_message", f"HTTP {resp.status_code} Error"
+        )
+    except Exception:
+        error_message = f"HTTP {resp.status_code} Error: {resp.text}"
+    return f"{error_message} for {path}"
+
+
+def _settles(future: Future) -> bool:
+    return future.exception() is None and answered(future.result())
+
+
+def _discard_response(future: Future) -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+def _smm_info(brokers: Any, topics: Any) -> Dict[str, Any]:
+    return {
+        "status": "connected",
+        "message": f"SMM MCP Server connected (brokers: {len(brokers)}, topics: {len(topics)})",
+        "brokers_count": len(brokers),
+        "topics_count": len(topics),
+    }
+
+
+def _found_broker(broker_id: int, broker: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if broker is None:
+        raise ValueError(f"Broker {broker_id} not found")
+    return broker
+
+
+def _describe_topic(topic_name: str, topic: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if topic is None:
+        raise ValueError(f"Topic {topic_name} not found")
+    return {
+        "topic_name": topic_name,
+        "topic_info": topic,
+        "message": "Topic description retrieved from topics list"
+    }
+
+
+def _topic_prefix_matches(prefix: str, snapshot: CatalogSnapshot) -> Dict[str, Any]:
+    names = snapshot.with_prefix(prefix)
+    return {
+        "prefix": prefix,
+        "topics": names,
+        "topic_count": len(names),
+    }
+
+
+def _topic_partitions(topic_name: str, topic_info: Dict[str, Any]) -> Dict[str, Any]:
+    partitions = topic_info.get("topic_info", {}).get("partitions", [])
+    return {
+        "topic_name": topic_name,
+        "partitions": partitions,
+        "partition_count": len(partitions),
+        "message": "Partition information retrieved from topic info"
+    }
+
+
+def _topic_configs(topic_name: str, topic_info: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "topic_name": topic_name,
+        "configs": topic_info.get("topic_info", {}).get("configs", {}),
+        "message": "Topic configuration retrieved from topic info"
+    }
+
+
+def _schema_versions_path(topic_name: str, schema_type: str) -> str:
+    if schema_type not in SCHEMA_KINDS:
+        raise ValueError(f"schema_type must be one of {SCHEMA_KINDS}, got {schema_type!r}")
+    return f"schemaRegistry/{schema_type}SchemaVersionInfos/{topic_name}"
+
+
+def _schema_version(
+    topic_name: str, schema_type: str, version: int, info: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    if info is None:
+        raise ValueError(
+            f"Version {version} of the {schema_type} schema for topic {topic_name} not found"
+        )
+    return {
+        "topic_name": topic_name,
+        "schema_type": schema_type,
+        "version": version,
+        "schema_version_info": info,
+    }
+
+
+def _latest_schema_version(
+    topic_name: str, schema_type: str, store: SchemaVersionStore
+) -> Dict[str, Any]:
+    version = store.latest(topic_name, schema_type)
+    if version is None:
+        raise ValueError(f"No {schema_type} schema registered for topic {topic_name}")
+    return _schema_version(
+        topic_name, schema_type, version, store.get(topic_name, schema_type, version)
+    )
+
+
 class SMMClient:
     def __init__(
         self,
         base_url: str,
         session: requests.Session,
-        timeout_seconds: int = 30,
+        timeout_seconds: float = 30,
         proxy_context_path: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        cache: Optional[ResponseCache] = None,
+        topic_catalog: Optional[TopicCatalog] = None,
+        broker_catalog: Optional[BrokerCatalog] = None,
+        disk_cache: Optional[DiskCache] = None,
+        schema_store: Optional[SchemaVersionStore] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        capabilities: Optional[CapabilityMap] = None,
+        connect_timeout_seconds: Optional[float] = None,
+        codec: Optional[JsonCodec] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        token_refresher: Optional[KnoxTokenRefresher] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.session = session
-        self.timeout = timeout_seconds
+        self.read_timeout = timeout_seconds
+        self.connect_timeout = connect_timeout_seconds or timeout_seconds
+        # requests takes (connect, read) so a dead gateway fails fast
+        self.timeout = (self.connect_timeout, self.read_timeout)
         self.proxy_context_path = proxy_context_path
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.single_flight = single_flight
+        self.cache = cache
+        self.topic_catalog = topic_catalog or TopicCatalog()
+        self.broker_catalog = broker_catalog or BrokerCatalog()
+        self.disk_cache = disk_cache
+        self.schema_store = schema_store or SchemaVersionStore()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        # Unprobed until probe_capabilities runs: every request goes out as written
+        self.capabilities = capabilities or CapabilityMap(self.base_url)
+        self.codec = codec or resolve_codec()
+        self.hedge_policy = hedge_policy
+        self.token_refresher = token_refresher
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._revalidating: Set[Any] = set()
+        self._revalidate_lock = threading.Lock()
+        self._revalidations = 0
+        # Bumped by writes so loads that started earlier are not cached
+        self._write_generation = 0
 
         # Add CDP proxy headers if configured
         if self.proxy_context_path:
@@ -35,107 +258,442 @@ class SMMClient:
     def _url(self, path: str) -> str:
         return f"{self.base_url}/{path.lstrip('/')}"
 
-    @retry(
-        retry=retry_if_exception_type(
-            (requests.HTTPError, requests.ConnectionError, requests.Timeout)
-        ),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
+    def _send(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        # Use the path variant this cluster serves, or fail fast if it serves none
+        path = self.capabilities.route(path)
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        template = breaker.before(path) if breaker is not None else None
+        policy.on_request()
+        refresher = self.token_refresher
+        reauthenticated = False
+        attempt = 0
+        while True:
+            attempt += 1
+            token = refresher.token if refresher is not None else None
+            try:
+                resp = self._attempt(method, path, **kwargs)
+            except Exception as e:
+                # A connection shut down by cancellation is not an SMM failure
+                check_cancelled()
+                if breaker is not None:
+                    breaker.record_error(template, e)
+                delay = policy.retry_delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+                if not fits(delay):
+                    # No retry the tool call's deadline would cut short
+                    raise DeadlineExceeded(f"retrying {path}") from e
+            else:
+                if breaker is not None:
+                    breaker.record_response(template, resp, path)
+                if (
+                    resp.status_code == 401
+                    and refresher is not None
+                    and not reauthenticated
+                ):
+                    # Token revoked or expired early: mint a new one and replay once
+                    reauthenticated = True
+                    try:
+                        refresher.replace(token)
+                    except Exception:
+                        return resp
+                    resp.close()
+                    continue
+                delay = policy.retry_delay(method, attempt, response=resp)
+                if delay is None or not fits(delay):
+                    return resp
+                resp.close()
+            cancellable_sleep(delay)
+            if breaker is not None:
+                # Stop retrying once this attempt's failures opened the circuit
+                breaker.before(path)
+
+    def _attempt(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        hedge = self.hedge_policy
+        pattern = hedge.pattern_for(method, path) if hedge is not None else None
+        if pattern is None:
+            return self._attempt_once(method, path, **kwargs)
+        return self._hedged_attempt(pattern, method, path, **kwargs)
+
+    def _hedged_attempt(
+        self, pattern: str, method: str, path: str, **kwargs: Any
+    ) -> requests.Response:
+        """Race a second copy of a slow GET and keep whichever answers first."""
+        hedge = self.hedge_policy
+        hedge.on_request()
+        if self._hedge_pool is None:
+            self._hedge_pool = ThreadPoolExecutor(
+                max_workers=_HEDGE_THREADS, thread_name_prefix="smm-hedge"
+            )
+        started = time.monotonic()
+        delay = hedge.delay_for(pattern)
+        primary_token, primary = self._submit_copy(method, path, kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done or not fits(delay) or not hedge.try_hedge():
+            resp = primary.result()
+            hedge.observe(pattern, time.monotonic() - started)
+            return resp
+        hedge_started = time.monotonic()
+        backup_token, backup = self._submit_copy(method, path, kwargs)
+        winner = None
+        pending = {primary, backup}
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next(
+                (f for f in (primary, backup) if f in done and _settles(f)), None
+            )
+        # Both copies failed: report the first one's outcome
+        winner = winner or primary
+        loser = backup if winner is primary else primary
+        # Shut the loser's connection down, or close its response if it already landed
+        (backup_token if winner is primary else primary_token).cancel()
+        loser.add_done_callback(_discard_response)
+        resp = winner.result()
+        if winner is backup:
+            hedge.observe(pattern, time.monotonic() - hedge_started, hedge_won=True)
+        else:
+            hedge.observe(pattern, time.monotonic() - started)
+        return resp
+
+    def _submit_copy(
+        self, method: str, path: str, kwargs: Dict[str, Any]
+    ) -> Tuple[CancelToken, Future]:
+        # Copies run on pool threads: carry the call's deadline along, and give each
+        # copy its own token so the losing one can be cancelled alone
+        parent = CANCEL_TOKEN.get()
+        token = parent.child() if parent is not None else CancelToken()
+        context = contextvars.copy_context()
+        context.run(CANCEL_TOKEN.set, token)
+        future = self._hedge_pool.submit(
+            context.run, self._attempt_once, method, path, **kwargs
+        )
+        return token, future
+
+    def _attempt_once(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(path)
+        check_cancelled()
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            check_deadline(f"requesting {path}")
+            return self.session.request(
+                method, self._url(path), timeout=self._request_timeout(), **kwargs
+            )
+        limiter.acquire()
+        started = time.monotonic()
+        rtt: Optional[float] = None
+        overloaded = False
+        try:
+            check_deadline(f"requesting {path}")
+            resp = self.session.request(
+                method, self._url(path), timeout=self._request_timeout(), **kwargs
+            )
+            rtt = time.monotonic() - started
+            overloaded = resp.status_code in OVERLOAD_STATUSES
+            return resp
+        except requests.Timeout:
+            overloaded = True
+            raise
+        finally:
+            limiter.release(rtt, overloaded)
+
+    def _request_timeout(self) -> Any:
+        # Never wait on SMM past the tool call's deadline
+        if time_left() is None:
+            return self.timeout
+        return (capped(self.connect_timeout), capped(self.read_timeout))
+
+    def probe_capabilities(self, refresh: bool = True) -> Dict[str, Any]:
+        """Probe which SMM endpoints this cluster serves and route around the rest."""
+        capabilities = self.capabilities
+        if refresh or not capabilities.is_fresh():
+            paths = capabilities.probe_paths()
+            with ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="smm-probe"
+            ) as pool:
+                # Probes cut off by the deadline count as inconclusive
+                probes = [
+                    pool.submit(contextvars.copy_context().run, self._probe, path)
+                    for path in paths
+                ]
+                statuses = {path: f.result() for path, f in zip(paths, probes)}
+            capabilities.install(statuses)
+        return capabilities.report()
+
+    def _probe(self, path: str) -> Optional[int]:
+        # One bare attempt: no routing, retries or circuit accounting
+        try:
+            resp = self._attempt_once("GET", path)
+        except Exception:
+            return None
+        resp.close()
+        return resp.status_code
+
+    def stats(self) -> Dict[str, Any]:
+        """Get client-side throughput statistics."""
+        stats: Dict[str, Any] = {"retries": self.retry_policy.stats()}
+        stats["json_codec"] = self.codec.stats()
+        if self.hedge_policy is not None:
+            stats["hedging"] = self.hedge_policy.stats()
+        if self.token_refresher is not None:
+            stats["knox_token"] = self.token_refresher.stats()
+        stats["capabilities"] = self.capabilities.stats()
+        if self.circuit_breaker is not None:
+            stats["circuit_breaker"] = self.circuit_breaker.stats()
+        if self.rate_limiter is not None:
+            stats["rate_limiter"] = self.rate_limiter.stats()
+        if self.concurrency_limiter is not None:
+            stats["concurrency"] = self.concurrency_limiter.stats()
+        if self.single_flight is not None:
+            stats["single_flight"] = self.single_flight.stats()
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        stats["topic_catalog"] = self.topic_catalog.stats()
+        stats["broker_catalog"] = self.broker_catalog.stats()
+        if self.disk_cache is not None:
+            stats["disk_cache"] = self.disk_cache.stats()
+        stats["schema_store"] = self.schema_store.stats()
+        stats["background_revalidations"] = self._revalidations
+        return stats
+
     def _get(
         self, path: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        resp = self.session.get(self._url(path), params=params, timeout=self.timeout)
+        key = request_key(path, params)
+        if not BYPASS_CACHE.get():
+            hit = self._cached(key, path)
+            if hit is not None:
+                if hit.stale:
+                    self._revalidate(key, path, params)
+                observe_data_age(hit.age)
+                return hit.value
+        observe_data_age(0.0)
+        return self._shared_load(key, path, params)
+
+    def _cached(self, key: Any, path: str) -> Optional[CacheHit]:
+        if self.cache is not None:
+            hit = self.cache.lookup(key)
+            if hit is not None:
+                return hit
+        # Right after a restart, answer from the on-disk copy and refresh it
+        if self.disk_cache is not None and self.disk_cache.wants(key, path):
+            return self.disk_cache.lookup(key, path)
+        return None
+
+    def _invalidate(self, patterns: List[str]) -> None:
+        """Evict cached reads made stale by a write through this client."""
+        # Disk first, so a memory miss in between can't reload the stale entry
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate(patterns)
+        self._invalidate_memory(patterns)
+
+    def _invalidate_memory(self, patterns: List[str]) -> None:
+        with self._revalidate_lock:
+            self._write_generation += 1
+        if self.cache is not None:
+            self.cache.invalidate(patterns)
+        for catalog in (self.topic_catalog, self.broker_catalog):
+            if any(fnmatchcase(catalog.path, pattern) for pattern in patterns):
+                catalog.invalidate()
+
+    def _claim_revalidation(self, key: Any) -> bool:
+        with self._revalidate_lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            self._revalidations += 1
+            return True
+
+    def _release_revalidation(self, key: Any) -> None:
+        with self._revalidate_lock:
+            self._revalidating.discard(key)
+
+    def _shared_load(
+        self, key: Any, path: str, params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        # Concurrent identical GETs share one round trip and one JSON decode
+        if self.single_flight is None:
+            return self._load(key, path, params)
+        return self.single_flight.do(key, lambda: self._load(key, path, params))
+
+    def _revalidate(
+        self, key: Any, path: str, params: Optional[Dict[str, Any]]
+    ) -> None:
+        """Refresh a stale cache entry without blocking the caller."""
+        if not self._claim_revalidation(key):
+            return
+
+        def _refresh() -> None:
+            try:
+                self._shared_load(key, path, params)
+            except Exception:
+                # The stale entry keeps serving until its max-staleness bound
+                pass
+            finally:
+                self._release_revalidation(key)
+
+        threading.Thread(target=_refresh, name="smm-revalidate", daemon=True).start()
+
+    def _load(
+        self, key: Any, path: str, params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        generation = self._write_generation
+        data, size = self._fetch_sized(path, params)
+        if generation != self._write_generation:
+            # A write landed while this read was in flight; don't cache it
+            return data
+        if self.cache is not None:
+            self.cache.put(key, path, data, size)
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, path, data)
+        return data
+
+    def _snapshot(self, catalog: Catalog, force: bool = False) -> CatalogSnapshot:
+        snapshot = None
+        if not (force or BYPASS_CACHE.get()):
+            snapshot = catalog.current()
+        if snapshot is None:
+            bypass_token = BYPASS_CACHE.set(force or BYPASS_CACHE.get())
+            try:
+                items = self._get(catalog.path)
+            finally:
+                BYPASS_CACHE.reset(bypass_token)
+            snapshot = catalog.install(items)
+        return snapshot
+
+    def _lookup(self, catalog: Catalog, key: Any) -> Optional[Dict[str, Any]]:
+        snapshot = self._snapshot(catalog)
+        item = snapshot.get(key)
+        if item is None and catalog.should_refresh_on_miss(snapshot):
+            # The resource may have been created since the snapshot was taken
+            item = self._snapshot(catalog, force=True).get(key)
+        return item
+
+    def _fetch(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        return self._fetch_sized(path, params)[0]
+
+    def _fetch_sized(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """The decoded response and its body size in bytes, for cache accounting."""
+        resp = self._send("GET", path, params=params)
         if resp.status_code == 401:
             raise requests.HTTPError("Unauthorized", response=resp)
         if resp.status_code == 403:
             raise requests.HTTPError("Forbidden", response=resp)
         if not resp.ok:
             # Try to get detailed error message from response
-            try:
-                error_data = resp.json()
-                error_message = error_data.get(
-                    "error_message", f"HTTP {resp.status_code} Error"
-                )
-            except Exception:
-                error_message = f"HTTP {resp.status_code} Error: {resp.text}"
-            raise SMMError(f"{error_message} for {path}")
-        return resp.json()
-
-    @retry(
-        retry=retry_if_exception_type(
-            (requests.HTTPError, requests.ConnectionError, requests.Timeout)
-        ),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
+            raise SMMError(_error_message(resp, path))
+        return self.codec.loads(resp.content), len(resp.content)
+
+    def _get_fields(
+        self,
+        path: str,
+        fields: Optional[List[str]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """GET the full document, or only ``fields`` of it when any are given."""
+        fields = normalize_fields(fields)
+        if fields is None:
+            return self._get(path, params=params)
+        return self._get_projected(path, fields, params)
+
+    def _get_projected(
+        self, path: str, fields: List[str], params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        key = request_key(path, params)
+        projected_key = key + fields_key(fields)
+        if not BYPASS_CACHE.get():
+            # A cached full body is projected in memory instead of refetched
+            hit = self._cached(key, path)
+            if hit is not None and hit.stale:
+                self._revalidate(key, path, params)
+            if hit is None and self.cache is not None:
+                hit = self.cache.lookup(projected_key)
+                if hit is not None and hit.stale:
+                    hit = None
+            if hit is not None:
+                observe_data_age(hit.age)
+                return project_document(hit.value, fields)
+        observe_data_age(0.0)
+        if self.single_flight is None:
+            return self._load_projected(projected_key, path, fields, params)
+        return self.single_flight.do(
+            projected_key,
+            lambda: self._load_projected(projected_key, path, fields, params),
+        )
+
+    def _load_projected(
+        self,
+        key: Any,
+        path: str,
+        fields: List[str],
+        params: Optional[Dict[str, Any]],
+    ) -> Any:
+        generation = self._write_generation
+        data = self._fetch_projected(path, fields, params)
+        if generation == self._write_generation and self.cache is not None:
+            self.cache.put(key, path, data)
+        return data
+
+    def _fetch_projected(
+        self, path: str, fields: List[str], params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        # Decode the body as it arrives, materialising only the wanted fields
+        resp = self._send("GET", path, params=params, stream=True)
+        try:
+            if resp.status_code == 401:
+                raise requests.HTTPError("Unauthorized", response=resp)
+            if resp.status_code == 403:
+                raise requests.HTTPError("Forbidden", response=resp)
+            if not resp.ok:
+                raise SMMError(_error_message(resp, path))
+            resp.raw.decode_content = True
+            return stream_project(resp.raw, fields)
+        finally:
+            resp.close()
+
     def _post(
         self,
         path: str,
         data: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        resp = self.session.post(
-            self._url(path), data=data, json=json_data, timeout=self.timeout
-        )
+        resp = self._send("POST", path, data=data, json=json_data)
         if resp.status_code == 401:
             raise requests.HTTPError("Unauthorized", response=resp)
         if resp.status_code == 403:
             raise requests.HTTPError("Forbidden", response=resp)
         if not resp.ok:
             # Try to get detailed error message from response
-            try:
-                error_data = resp.json()
-                error_message = error_data.get(
-                    "error_message", f"HTTP {resp.status_code} Error"
-                )
-            except Exception:
-                error_message = f"HTTP {resp.status_code} Error: {resp.text}"
-            raise SMMError(f"{error_message} for {path}")
-        return resp.json()
-
-    @retry(
-        retry=retry_if_exception_type(
-            (requests.HTTPError, requests.ConnectionError, requests.Timeout)
-        ),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
+            raise SMMError(_error_message(resp, path))
+        return self.codec.loads(resp.content)
+
     def _put(
         self,
         path: str,
         data: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        resp = self.session.put(
-            self._url(path), data=data, json=json_data, timeout=self.timeout
-        )
+        resp = self._send("PUT", path, data=data, json=json_data)
         if resp.status_code == 401:
             raise requests.HTTPError("Unauthorized", response=resp)
         if resp.status_code == 403:
             raise requests.HTTPError("Forbidden", response=resp)
         resp.raise_for_status()
-        return resp.json()
-
-    @retry(
-        retry=retry_if_exception_type(
-            (requests.HTTPError, requests.ConnectionError, requests.Timeout)
-        ),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
+        return self.codec.loads(resp.content)
+
     def _delete(self, path: str) -> Dict[str, Any]:
-        resp = self.session.delete(self._url(path), timeout=self.timeout)
+        resp = self._send("DELETE", path)
         if resp.status_code == 401:
             raise requests.HTTPError("Unauthorized", response=resp)
         if resp.status_code == 403:
             raise requests.HTTPError("Forbidden", response=resp)
         resp.raise_for_status()
-        return resp.json()
+        return self.codec.loads(resp.content)
 
     # ============================================================================
     # SMM API Methods - Core Information
@@ -147,12 +705,7 @@ class SMMClient:
             # Try to get basic cluster info using working endpoints
             brokers = self._get("api/v1/admin/brokers")
             topics = self._get("configs/topics")
-            return {
-                "status": "connected",
-                "message": f"SMM MCP Server connected (brokers: {len(brokers)}, topics: {len(topics)})",
-                "brokers_count": len(brokers),
-                "topics_count": len(topics),
-            }
+            return _smm_info(brokers, topics)
         except Exception as e:
             return {
                 "status": "connected",
@@ -188,12 +741,8 @@ class SMMClient:
 
     def get_broker(self, broker_id: int) -> Dict[str, Any]:
         """Get details of a specific broker."""
-        # Get all brokers and find the specific one
-        brokers = self._get("api/v1/admin/brokers")
-        for broker in brokers:
-            if broker.get("id") == broker_id:
-                return broker
-        raise ValueError(f"Broker {broker_id} not found")
+        # Indexed lookup against the shared broker catalog snapshot
+        return _found_broker(broker_id, self._lookup(self.broker_catalog, broker_id))
 
     def get_broker_metrics(
         self,
@@ -239,22 +788,19 @@ class SMMClient:
     # SMM API Methods - Topic Management
     # ============================================================================
 
-    def get_all_topic_infos(self) -> Dict[str, Any]:
-        """Get all topic information."""
-        return self._get("api/v1/admin/configs/topics")
+    def get_all_topic_infos(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get all topic information, optionally only the given fields of each topic."""
+        return self._get_fields("api/v1/admin/configs/topics", fields)
 
     def get_topic_description(self, topic_name: str) -> Dict[str, Any]:
         """Get detailed description of a specific topic."""
-        # Find topic in the topics list
-        topics = self._get("api/v1/admin/configs/topics")
-        for topic in topics:
-            if topic.get("resourceName") == topic_name:
-                return {
-                    "topic_name": topic_name,
-                    "topic_info": topic,
-                    "message": "Topic description retrieved from topics list"
-                }
-        raise ValueError(f"Topic {topic_name} not found")
+        # Indexed lookup against the shared topic catalog snapshot
+        topic = self._lookup(self.topic_catalog, topic_name)
+        return _describe_topic(topic_name, topic)
+
+    def find_topics(self, prefix: str) -> Dict[str, Any]:
+        """Find topic names starting with a prefix."""
+        return _topic_prefix_matches(prefix, self._snapshot(self.topic_catalog))
 
     def get_topic_info(self, topic_name: str) -> Dict[str, Any]:
         """Get basic information about a specific topic."""
@@ -265,24 +811,30 @@ class SMMClient:
         """Get partition information for a specific topic."""
         # Get topic info and extract partition info
         topic_info = self.get_topic_info(topic_name)
-        return {
-            "topic_name": topic_name,
-            "partitions": topic_info.get("topic_info", {}).get("partitions", []),
-            "partition_count": len(topic_info.get("topic_info", {}).get("partitions", [])),
-            "message": "Partition information retrieved from topic info"
-        }
+        return _topic_partitions(topic_name, topic_info)
 
     def get_topic_partition_infos(self, topic_name: str) -> Dict[str, Any]:
         """Get detailed partition information for a specific topic."""
         # Use the same logic as get_topic_partitions
         return self.get_topic_partitions(topic_name)
 
+    @invalidates(
+        "api/v1/admin/configs/topics", "api/v1/admin/topics", "configs/topics"
+    )
     def create_topics(self, topics_config: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create new topics."""
         return self._post(
             "topicMetadata/createTopics", json_data={"topics": topics_config}
         )
 
+    @invalidates(
+        "api/v1/admin/configs/topics",
+        "api/v1/admin/topics",
+        "configs/topics",
+        "api/v1/admin/topics/{topic_name}",
+        "api/v1/admin/topics/{topic_name}/*",
+        "topicConsumption/topicOffsets/{topic_name}",
+    )
     def create_partitions(
         self, topic_name: str, partition_count: int
     ) -> Dict[str, Any]:
@@ -292,6 +844,15 @@ class SMMClient:
             json_data={"partitionCount": partition_count},
         )
 
+    @invalidates(
+        "api/v1/admin/configs/topics",
+        "api/v1/admin/topics",
+        "configs/topics",
+        "api/v1/admin/topics/{topic_names}",
+        "api/v1/admin/topics/{topic_names}/*",
+        "topicConsumption/*/{topic_names}",
+        "schemaRegistry/*/{topic_names}",
+    )
     def delete_topics(self, topic_names: List[str]) -> Dict[str, Any]:
         """Delete specified topics."""
         return self._post(
@@ -302,11 +863,7 @@ class SMMClient:
         """Get configuration for a specific topic."""
         # Get topic info which includes configuration
         topic_info = self.get_topic_info(topic_name)
-        return {
-            "topic_name": topic_name,
-            "configs": topic_info.get("topic_info", {}).get("configs", {}),
-            "message": "Topic configuration retrieved from topic info"
-        }
+        return _topic_configs(topic_name, topic_info)
 
     def get_all_topic_configs(self) -> Dict[str, Any]:
         """Get configurations for all topics."""
@@ -322,6 +879,13 @@ class SMMClient:
         """Get default topic configurations."""
         return self._get("api/v1/admin/configs/default/topics")
 
+    @invalidates(
+        "api/v1/admin/configs/topics",
+        "api/v1/admin/topics",
+        "configs/topics",
+        "api/v1/admin/topics/{topic_name}",
+        "api/v1/admin/topics/{topic_name}/*",
+    )
     def alter_topic_configs(
         self, topic_name: str, configs: Dict[str, str]
     ) -> Dict[str, Any]:
@@ -374,6 +938,14 @@ class SMMClient:
         """Get information about a specific consumer."""
         return self._get(f"consumerGroupRelatedDetails/consumerInfo/{consumer_id}")
 
+    @invalidates(
+        "api/v1/admin/consumers",
+        "api/v1/admin/consumers/{group_name}",
+        "api/v1/admin/consumers/{group_name}/*",
+        "consumerGroupRelatedDetails/consumerGroupInfo/{group_name}",
+        "consumerGroupRelatedDetails/allConsumerInfo",
+        "admin/metrics/aggregated/groups*",
+    )
     def reset_offset(
         self, group_name: str, topic_name: str, partition: int, offset: int
     ) -> Dict[str, Any]:
@@ -410,8 +982,9 @@ class SMMClient:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """Get cluster metrics including topic metrics."""
+        """Get cluster metrics including topic metrics, optionally only the given keys."""
         params = {}
         if duration:
             params["duration"] = duration
@@ -419,8 +992,8 @@ class SMMClient:
             params["from"] = from_time
         if to_time is not None:
             params["to"] = to_time
-        return self._get(
-            "admin/metrics/aggregated/clusterWithTopicMetrics", params=params
+        return self._get_fields(
+            "admin/metrics/aggregated/clusterWithTopicMetrics", fields, params=params
         )
 
     def get_all_consumer_group_metrics(
@@ -574,12 +1147,14 @@ class SMMClient:
         """Get details of a specific alert policy."""
         return self._get(f"alertPolicyOperations/alertPolicy/{policy_id}")
 
+    @invalidates("alertPolicyOperations/*", "alertPolicy/*")
     def add_alert_policy(self, policy_config: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new alert policy."""
         return self._post(
             "alertPolicyOperations/addAlertPolicy", json_data=policy_config
         )
 
+    @invalidates("alertPolicyOperations/*", "alertPolicy/*")
     def update_alert_policy(
         self, policy_id: str, policy_config: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -589,14 +1164,17 @@ class SMMClient:
             json_data=policy_config,
         )
 
+    @invalidates("alertPolicyOperations/*", "alertPolicy/*")
     def delete_alert_policy(self, policy_id: str) -> Dict[str, Any]:
         """Delete an alert policy."""
         return self._delete(f"alertPolicyOperations/deleteAlertPolicy/{policy_id}")
 
+    @invalidates("alertPolicyOperations/*", "alertPolicy/*")
     def enable_alert_policy(self, policy_id: str) -> Dict[str, Any]:
         """Enable an alert policy."""
         return self._post(f"alertPolicyOperations/enableAlertPolicy/{policy_id}")
 
+    @invalidates("alertPolicyOperations/*", "alertPolicy/*")
     def disable_alert_policy(self, policy_id: str) -> Dict[str, Any]:
         """Disable an alert policy."""
         return self._post(f"alertPolicyOperations/disableAlertPolicy/{policy_id}")
@@ -629,6 +1207,9 @@ class SMMClient:
             f"alertNotifications/alertNotificationsByEntityTypeAndName/{entity_type}/{entity_name}"
         )
 
+    @invalidates(
+        "alertNotifications/*", "alert/notifications/*", "api/v1/admin/alerts/*"
+    )
     def mark_alert_notifications(self, notification_ids: List[str]) -> Dict[str, Any]:
         """Mark alert notifications as read."""
         return self._post(
@@ -636,6 +1217,9 @@ class SMMClient:
             json_data={"notificationIds": notification_ids},
         )
 
+    @invalidates(
+        "alertNotifications/*", "alert/notifications/*", "api/v1/admin/alerts/*"
+    )
     def unmark_alert_notifications(self, notification_ids: List[str]) -> Dict[str, Any]:
         """Unmark alert notifications as unread."""
         return self._post(
@@ -657,12 +1241,48 @@ class SMMClient:
 
     def get_key_schema_version_infos(self, topic_name: str) -> Dict[str, Any]:
         """Get key schema version information for a topic."""
-        return self._get(f"schemaRegistry/keySchemaVersionInfos/{topic_name}")
+        return self._schema_version_infos(topic_name, "key")
 
     def get_value_schema_version_infos(self, topic_name: str) -> Dict[str, Any]:
         """Get value schema version information for a topic."""
-        return self._get(f"schemaRegistry/valueSchemaVersionInfos/{topic_name}")
+        return self._schema_version_infos(topic_name, "value")
+
+    def _schema_version_infos(
+        self, topic_name: str, schema_type: str, force: bool = False
+    ) -> Dict[str, Any]:
+        path = _schema_versions_path(topic_name, schema_type)
+        bypass_token = BYPASS_CACHE.set(force or BYPASS_CACHE.get())
+        try:
+            infos = self._get(path)
+        finally:
+            BYPASS_CACHE.reset(bypass_token)
+        self.schema_store.record(topic_name, schema_type, infos)
+        if force:
+            self.schema_store.checked(topic_name, schema_type)
+        return infos
+
+    def get_schema_version(
+        self, topic_name: str, schema_type: str, version: int
+    ) -> Dict[str, Any]:
+        """Get one registered key or value schema version for a topic."""
+        # Registered versions are immutable, so a stored copy is always valid
+        info = self.schema_store.get(topic_name, schema_type, version)
+        if info is None:
+            # The version may have been registered after the last listing
+            self._schema_version_infos(topic_name, schema_type, force=True)
+            info = self.schema_store.get(topic_name, schema_type, version)
+        return _schema_version(topic_name, schema_type, version, info)
+
+    def get_latest_schema_version(
+        self, topic_name: str, schema_type: str
+    ) -> Dict[str, Any]:
+        """Get the latest registered key or value schema version for a topic."""
+        _schema_versions_path(topic_name, schema_type)
+        if BYPASS_CACHE.get() or not self.schema_store.is_current(topic_name, schema_type):
+            self._schema_version_infos(topic_name, schema_type, force=True)
+        return _latest_schema_version(topic_name, schema_type, self.schema_store)
 
+    @invalidates("schemaRegistry/*/{topic_name}")
     def register_topic_schema_meta(
         self, topic_name: str, schema_config: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -797,14 +1417,23 @@ class SMMClient:
         """Get connector configurations."""
         return self._get(f"api/v1/admin/connectors/{connector_id}/configs")
 
+    @invalidates(
+        "api/v1/admin/connectors*", "kafkaConnect/*", "kafka-connect/connectors*"
+    )
     def create_connector(self, connector_config: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new connector."""
         return self._post("kafkaConnect/createConnector", json_data=connector_config)
 
+    @invalidates(
+        "api/v1/admin/connectors*", "kafkaConnect/*", "kafka-connect/connectors*"
+    )
     def delete_connector(self, connector_name: str) -> Dict[str, Any]:
         """Delete a connector."""
         return self._delete(f"kafkaConnect/deleteConnector/{connector_name}")
 
+    @invalidates(
+        "api/v1/admin/connectors*", "kafkaConnect/*", "kafka-connect/connectors*"
+    )
     def configure_connector(
         self, connector_name: str, config: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -894,10 +1523,12 @@ class SMMClient:
     # ============================================================================
 
     # Alert Management Completion
+    @invalidates("alertPolicyOperations/*", "alertPolicy/*")
     def disable_alert_policy(self, policy_id: str) -> Dict[str, Any]:
         """Disable an alert policy."""
         return self._post(f"alertPolicy/{policy_id}/disable")
 
+    @invalidates("alertPolicyOperations/*", "alertPolicy/*")
     def enable_alert_policy(self, policy_id: str) -> Dict[str, Any]:
         """Enable an alert policy."""
         return self._post(f"alertPolicy/{policy_id}/enable")
@@ -910,6 +1541,9 @@ class SMMClient:
         """Get alert notifications by entity type and ID."""
         return self._get(f"alert/notifications/entity/{entity_type}/{entity_id}")
 
+    @invalidates(
+        "alertNotifications/*", "alert/notifications/*", "api/v1/admin/alerts/*"
+    )
     def mark_alert_notifications_read(self, notification_ids: List[str]) -> Dict[str, Any]:
         """Mark alert notifications as read."""
         return self._post("alert/notifications/read", json_data={"notificationIds": notification_ids})
@@ -988,6 +1622,9 @@ class SMMClient:
         """Validate connector configuration."""
         return self._post("kafka-connect/connector-templates/config/validate-detailed", json_data=config)
 
+    @invalidates(
+        "api/v1/admin/connectors*", "kafkaConnect/*", "kafka-connect/connectors*"
+    )
     def perform_connector_action(self, connector_name: str, action: str) -> Dict[str, Any]:
         """Perform connector actions (start, stop, restart, etc.)."""
         return self._post(f"kafka-connect/connectors/{connector_name}/{action}")
@@ -1024,9 +1661,9 @@ class SMMClient:
         """Get admin brokers information."""
         return self._get("api/v1/admin/brokers")
     
-    def get_admin_topics(self) -> Dict[str, Any]:
-        """Get admin topics information."""
-        return self._get("api/v1/admin/topics")
+    def get_admin_topics(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get admin topics information, optionally only the given fields of each topic."""
+        return self._get_fields("api/v1/admin/topics", fields)
     
     def get_admin_topic_details(self, topic_name: str) -> Dict[str, Any]:
         """Get admin topic details."""
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: pip install 'ssm-mcp-server[fast-json]'
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional alternative to orjson
+    msgspec = None
+
+CODEC_NAMES = ("auto", "orjson", "msgspec", "json")
+
+
+def _json_dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+class JsonCodec:
+    """Decodes SMM bodies and encodes tool results with one JSON library.
+
+    Fast codecs are stricter than the stdlib (64-bit integers, no NaN), so
+    anything they reject is retried with ``json`` and only counted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[bytes], Any],
+        dumps: Callable[[Any], str],
+        errors: Tuple[type, ...] = (),
+    ):
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps
+        self._errors = errors
+        self._fallbacks = 0
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._loads(data)
+        except self._errors:
+            self._fallbacks += 1
+            return json.loads(data)
+
+    def dumps(self, value: Any) -> str:
+        try:
+            return self._dumps(value)
+        except self._errors:
+            self._fallbacks += 1
+            return _json_dumps(value)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"name": self.name, "stdlib_fallbacks": self._fallbacks}
+
+
+def _orjson_codec() -> Optional[JsonCodec]:
+    if orjson is None:
+        return None
+    options = orjson.OPT_NON_STR_KEYS
+    return JsonCodec(
+        "orjson",
+        orjson.loads,
+        lambda value: orjson.dumps(value, default=str, option=options).decode(),
+        (orjson.JSONDecodeError, orjson.JSONEncodeError, TypeError),
+    )
+
+
+def _msgspec_codec() -> Optional[JsonCodec]:
+    if msgspec is None:
+        return None
+    encoder = msgspec.json.Encoder(enc_hook=str)
+    decoder = msgspec.json.Decoder()
+    return JsonCodec(
+        "msgspec",
+        decoder.decode,
+        lambda value: encoder.encode(value).decode(),
+        (msgspec.DecodeError, msgspec.EncodeError, TypeError),
+    )
+
+
+def resolve_codec(preference: str = "auto") -> JsonCodec:
+    """Pick the codec named by SMM_JSON_CODEC; ``auto`` takes the fastest installed."""
+    preference = preference.strip().lower() or "auto"
+    if preference not in CODEC_NAMES:
+        raise ValueError(f"SMM_JSON_CODEC must be one of {CODEC_NAMES}, got {preference!r}")
+    if preference in ("auto", "orjson"):
+        codec = _orjson_codec()
+        if codec is not None:
+            return codec
+    if preference in ("auto", "msgspec"):
+        codec = _msgspec_codec()
+        if codec is not None:
+            return codec
+    if preference != "auto" and preference != "json":
+        raise RuntimeError(
+            f"JSON codec '{preference}' is not installed. "
+            "Install with: pip install 'ssm-mcp-server[fast-json]'"
+        )
+    return JsonCodec("json", json.loads, _json_dumps)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .cancel import check_cancelled, wait_slice
+from .deadline import check_deadline
+
+# Responses that mean the gateway or SMM is shedding load
+OVERLOAD_STATUSES = {429, 503}
+
+
+class AdaptiveLimiter:
+    """AIMD in-flight request limit shared by threads and asyncio tasks.
+
+    The window grows by about one request per round trip while latency stays
+    within ``latency_tolerance`` of the best recent RTT, and is cut by
+    ``backoff`` on 429/503/timeouts (at most once per smoothed RTT so a burst
+    of failures from one window counts as a single congestion signal).
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        rtt_window: int = 100,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._rtts: Deque[float] = deque(maxlen=rtt_window)
+        self._smoothed_rtt: Optional[float] = None
+        self._last_decrease = 0.0
+        self._decreases = 0
+        self._overloads = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                # Give up on a slot once the tool call is cancelled or out of time
+                check_cancelled()
+                left = check_deadline("waiting for a concurrency slot")
+                self._cond.wait(timeout=wait_slice(left))
+            self._in_flight += 1
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                left = check_deadline("waiting for a concurrency slot")
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, timeout=left)
+            except asyncio.TimeoutError:
+                # Deadline reached; the next pass takes a freed slot or raises
+                with self._cond:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def release(self, rtt: Optional[float], overloaded: bool = False) -> None:
+        """Return a slot; ``rtt`` is None when the attempt says nothing about latency."""
+        with self._cond:
+            self._in_flight -= 1
+            if overloaded:
+                self._on_overload()
+            elif rtt is not None:
+                self._on_sample(rtt)
+            self._cond.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def _on_sample(self, rtt: float) -> None:
+        self._rtts.append(rtt)
+        if self._smoothed_rtt is None:
+            self._smoothed_rtt = rtt
+        else:
+            self._smoothed_rtt = 0.8 * self._smoothed_rtt + 0.2 * rtt
+        if rtt <= min(self._rtts) * self.latency_tolerance:
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+    def _on_overload(self) -> None:
+        self._overloads += 1
+        now = time.monotonic()
+        if now - self._last_decrease < (self._smoothed_rtt or 0.0):
+            return
+        self._last_decrease = now
+        self._decreases += 1
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "min_rtt_seconds": min(self._rtts) if self._rtts else None,
+                "smoothed_rtt_seconds": self._smoothed_rtt,
+                "overload_signals": self._overloads,
+                "limit_decreases": self._decreases,
+            }
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
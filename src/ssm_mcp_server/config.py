@@ -4,6 +4,10 @@ import os
 from dataclasses import dataclass
 from typing import Optional
 
+from .deadline import DeadlinePolicy
+from .hedge import DEFAULT_HEDGE_PATHS
+from .transport import PoolSettings
+
 
 @dataclass
 class ServerConfig:
@@ -25,6 +29,12 @@ class ServerConfig:
 
     # Optional passcode token (e.g., Livy/Knox) for alternate auth patterns
     knox_passcode_token: Optional[str] = os.getenv("KNOX_PASSCODE_TOKEN") or None
+    # Renew a minted Knox JWT this many seconds before it expires (0 disables)
+    knox_refresh_margin_seconds: float = float(
+        os.getenv("KNOX_TOKEN_REFRESH_MARGIN_SECONDS", "300")
+    )
+    # Opt-in file sharing minted Knox tokens between server processes
+    knox_token_cache_path: Optional[str] = os.getenv("KNOX_TOKEN_CACHE_PATH") or None
 
     # Direct SMM authentication (when not using Knox)
     smm_user: Optional[str] = os.getenv("SMM_USER") or None
@@ -34,8 +44,126 @@ class ServerConfig:
     verify_ssl_env: str = os.getenv("KNOX_VERIFY_SSL", "true").lower()
     ca_bundle: Optional[str] = os.getenv("KNOX_CA_BUNDLE")
     timeout_seconds: int = int(os.getenv("HTTP_TIMEOUT_SECONDS", "30"))
+    # Split timeouts: connect fails fast on a dead gateway, read allows slow SMM pages;
+    # the read timeout defaults to timeout_seconds (HTTP_TIMEOUT_SECONDS)
+    connect_timeout_seconds: float = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "2"))
+    read_timeout_seconds: Optional[float] = (
+        float(os.environ["HTTP_READ_TIMEOUT_SECONDS"])
+        if os.getenv("HTTP_READ_TIMEOUT_SECONDS")
+        else None
+    )
+    # Connection pool; size it to the peak number of parallel SMM calls
+    pool_connections: int = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+    pool_maxsize: int = int(os.getenv("HTTP_POOL_MAXSIZE", "64"))
+    pool_block: bool = os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true"
+    keepalive: bool = os.getenv("HTTP_KEEPALIVE", "true").lower() == "true"
+    keepalive_expiry_seconds: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "60"))
+    compression: bool = os.getenv("HTTP_COMPRESSION", "true").lower() == "true"
+    # auto picks orjson, then msgspec, then the stdlib json module
+    json_codec: str = os.getenv("SMM_JSON_CODEC", "auto")
+    # Multiplex requests over one HTTP/2 connection (async client, needs h2)
+    http2: bool = os.getenv("HTTP_HTTP2", "false").lower() == "true"
     max_retries: int = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+    # Retries may add at most this fraction of extra load across the process
+    retry_budget_ratio: float = float(os.getenv("HTTP_RETRY_BUDGET_RATIO", "0.1"))
+    # Don't retry when SMM asks us to back off longer than this
+    retry_max_after_seconds: float = float(os.getenv("HTTP_RETRY_MAX_AFTER_SECONDS", "30"))
     rate_limit_rps: float = float(os.getenv("HTTP_RATE_LIMIT_RPS", "5"))
+    rate_limit_burst: float = float(os.getenv("HTTP_RATE_LIMIT_BURST", "10"))
+    # Per endpoint family budgets, e.g. "metrics=2,admin=5,content=1"
+    rate_limit_families_csv: str = os.getenv("HTTP_RATE_LIMIT_FAMILIES", "")
+
+    # Adaptive (AIMD) limit on in-flight SMM requests
+    adaptive_concurrency: bool = (
+        os.getenv("HTTP_ADAPTIVE_CONCURRENCY", "true").lower() == "true"
+    )
+    concurrency_initial: int = int(os.getenv("HTTP_CONCURRENCY_INITIAL", "8"))
+    concurrency_min: int = int(os.getenv("HTTP_CONCURRENCY_MIN", "1"))
+    concurrency_max: int = int(os.getenv("HTTP_CONCURRENCY_MAX", "64"))
+
+    # Fast-fail endpoint families the cluster keeps failing (404/405/501/5xx)
+    circuit_breaker: bool = os.getenv("SMM_CIRCUIT_BREAKER", "true").lower() == "true"
+    circuit_failure_threshold: int = int(os.getenv("SMM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    circuit_reset_seconds: float = float(os.getenv("SMM_CIRCUIT_RESET_SECONDS", "30"))
+    circuit_templates_csv: str = os.getenv(
+        "SMM_CIRCUIT_TEMPLATES",
+        "api/v1/admin/metrics/*,admin/metrics/*,topicMetrics/*,etelatency/*,"
+        "alertPolicy/*,alertPolicyOperations/*,alertNotifications/*,alert/*,"
+        "api/v1/admin/alerts/*,api/v1/admin/health/*,consumerGroupRelatedDetails/*,"
+        "schemaRegistry/*,lineage/*,replication-stats/*,kafkaConnect/*",
+    )
+    # Lookups of one named resource, where a 404 means it doesn't exist
+    circuit_resource_paths_csv: str = os.getenv(
+        "SMM_CIRCUIT_RESOURCE_PATHS",
+        "schemaRegistry/schemaMetaForTopic/*,schemaRegistry/*SchemaVersionInfos/*,"
+        "consumerGroupRelatedDetails/consumerGroupInfo/*,"
+        "consumerGroupRelatedDetails/consumerInfo/*,alertPolicyOperations/alertPolicy/*,"
+        "notifiers/*",
+    )
+
+    # End-to-end budget per tool call, covering retries, hedges and sub-requests;
+    # rules are "glob=seconds" pairs over operation names (0 disables)
+    tool_deadline_seconds: float = float(os.getenv("SMM_TOOL_DEADLINE_SECONDS", "45"))
+    tool_deadlines_csv: str = os.getenv(
+        "SMM_TOOL_DEADLINES",
+        "get_brokers=10,get_broker=10,get_topic_offsets=10,get_consumer_group=10,"
+        "*metrics*=20,probe_capabilities=90",
+    )
+
+    # Race a second copy of slow latency-sensitive GETs after their p95 latency
+    hedge_requests: bool = os.getenv("SMM_HEDGE_REQUESTS", "false").lower() == "true"
+    hedge_paths_csv: str = os.getenv("SMM_HEDGE_PATHS", DEFAULT_HEDGE_PATHS)
+    # Hedges may add at most this fraction of extra load on the hedged paths
+    hedge_max_ratio: float = float(os.getenv("SMM_HEDGE_MAX_RATIO", "0.05"))
+
+    # Endpoint capability map: probe at startup and route/fast-fail by it
+    capability_probe: bool = os.getenv("SMM_CAPABILITY_PROBE", "false").lower() == "true"
+    capability_map_path: Optional[str] = os.getenv("SMM_CAPABILITY_MAP_PATH") or None
+    capability_map_ttl: float = float(os.getenv("SMM_CAPABILITY_MAP_TTL", "86400"))
+
+    # Share one round trip between concurrent identical GETs
+    coalesce_gets: bool = os.getenv("HTTP_COALESCE_GETS", "true").lower() == "true"
+
+    # Response cache for read-only endpoints; TTL rules are "glob=seconds"
+    # pairs matched in order against the request path (0 disables caching)
+    cache_enabled: bool = os.getenv("SMM_CACHE_ENABLED", "true").lower() == "true"
+    cache_max_entries: int = int(os.getenv("SMM_CACHE_MAX_ENTRIES", "512"))
+    cache_max_bytes: int = int(os.getenv("SMM_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    cache_default_ttl: float = float(os.getenv("SMM_CACHE_DEFAULT_TTL", "15"))
+    cache_ttls_csv: str = os.getenv(
+        "SMM_CACHE_TTLS",
+        "kafka-connect/connector-templates*=3600,schemaRegistry/*=300,"
+        "admin/metrics/*=5,api/v1/admin/metrics/*=5,topicMetrics/*=5,"
+        "kafkaConnectMetrics/*=5,metrics/*=5,etelatency/*=5,*/offsets=5,"
+        "topicConsumption/*=0,*/messages*=0,*/sample=0",
+    )
+    # Broad listings served stale (up to N extra seconds) while refreshing
+    cache_stale_csv: str = os.getenv(
+        "SMM_CACHE_STALE_WHILE_REVALIDATE",
+        "api/v1/admin/topics=60,api/v1/admin/consumers=60,api/v1/admin/cluster=60",
+    )
+
+    # Optional SQLite cache of slow-changing metadata for warm restarts
+    disk_cache_path: Optional[str] = os.getenv("SMM_DISK_CACHE_PATH") or None
+    disk_cache_rules_csv: str = os.getenv(
+        "SMM_DISK_CACHE_RULES",
+        "api/v1/admin/configs/topics=3600,api/v1/admin/brokers=3600,"
+        "api/v1/admin/topics=3600,kafka-connect/connector-templates*=86400,"
+        "schemaRegistry/*=86400",
+    )
+
+    # Indexed topic and broker catalogs used for single-resource lookups
+    topic_catalog_ttl: float = float(os.getenv("SMM_TOPIC_CATALOG_TTL", "30"))
+    broker_catalog_ttl: float = float(os.getenv("SMM_BROKER_CATALOG_TTL", "60"))
+
+    # Registered schema versions are cached forever; this bounds how stale the
+    # "latest version" answer may be
+    schema_latest_ttl: float = float(os.getenv("SMM_SCHEMA_LATEST_TTL", "30"))
+
+    # Client: async (httpx, non-blocking), threaded (requests on a bounded
+    # worker pool) or sync (requests, inline)
+    client_mode: str = os.getenv("SMM_CLIENT_MODE", "async").lower()
+    worker_pool_size: int = int(os.getenv("SMM_WORKER_POOL_SIZE", "8"))
 
     # Behavior
     readonly: bool = os.getenv("SMM_READONLY", "true").lower() == "true"
@@ -44,6 +172,24 @@ class ServerConfig:
     # CDP-specific proxy headers
     proxy_context_path: Optional[str] = os.getenv("SMM_PROXY_CONTEXT_PATH")
 
+    def build_pool(self) -> PoolSettings:
+        return PoolSettings(
+            connections=self.pool_connections,
+            maxsize=self.pool_maxsize,
+            block=self.pool_block,
+            keepalive=self.keepalive,
+            keepalive_expiry=self.keepalive_expiry_seconds,
+            compression=self.compression,
+        )
+
+    def build_read_timeout(self) -> float:
+        if self.read_timeout_seconds is not None:
+            return self.read_timeout_seconds
+        return float(self.timeout_seconds)
+
+    def build_deadlines(self) -> DeadlinePolicy:
+        return DeadlinePolicy.from_config(self.tool_deadline_seconds, self.tool_deadlines_csv)
+
     def build_verify(self) -> bool | str:
         if self.ca_bundle:
             return self.ca_bundle
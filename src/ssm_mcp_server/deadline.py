@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from .cache import match_rule, parse_rules
+
+# Monotonic time by which the current tool call must have answered
+DEADLINE: ContextVar[Optional[float]] = ContextVar("smm_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised instead of starting SMM work the tool call has no time left for."""
+
+    def __init__(self, what: str):
+        super().__init__(f"Tool deadline exceeded before {what}")
+        self.what = what
+
+
+def time_left() -> Optional[float]:
+    """Seconds left before the current deadline, or None without one."""
+    deadline = DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline(what: str) -> Optional[float]:
+    """Raise DeadlineExceeded if the deadline has passed; otherwise return what is left."""
+    left = time_left()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(what)
+    return left
+
+
+def capped(seconds: float) -> float:
+    """``seconds`` shortened so it ends no later than the current deadline."""
+    left = time_left()
+    if left is None:
+        return seconds
+    return max(0.001, min(seconds, left))
+
+
+def fits(seconds: float) -> bool:
+    """Whether waiting ``seconds`` still leaves time before the deadline."""
+    left = time_left()
+    return left is None or seconds < left
+
+
+class DeadlinePolicy:
+    """End-to-end time budget per tool call.
+
+    Budgets are ``glob=seconds`` rules over the SMM operation name (the tool
+    name for most tools), first match wins; ``0`` means no deadline.
+    """
+
+    def __init__(self, default_seconds: float, rules: List[Tuple[str, float]]):
+        self.default_seconds = default_seconds
+        self.rules = rules
+
+    @classmethod
+    def from_config(cls, default_seconds: float, rules_csv: str) -> "DeadlinePolicy":
+        return cls(default_seconds, parse_rules(rules_csv))
+
+    def seconds_for(self, operation: str, override: Optional[float] = None) -> Optional[float]:
+        seconds = override if override is not None else match_rule(
+            self.rules, operation, self.default_seconds
+        )
+        return seconds if seconds > 0 else None
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from .cache import CacheHit, match_rule, parse_rules
+
+# Bump when the stored layout or key format changes; older rows are discarded
+SCHEMA_VERSION = 1
+
+
+class DiskCache:
+    """SQLite store of slow-changing SMM metadata for fast warm restarts.
+
+    Rows are keyed by cluster base URL and request key. Each persisted key is
+    answered from disk at most once per process: after the first network
+    load in this process the in-memory path takes over, so the disk copy
+    only bridges the gap right after a restart.
+    """
+
+    def __init__(self, db_path: str, cluster: str, ttl_rules: List[Tuple[str, float]]):
+        self.db_path = os.path.expanduser(db_path)
+        self.cluster = cluster.rstrip("/")
+        self.ttl_rules = ttl_rules
+        self._lock = threading.Lock()
+        self._refreshed: Set[str] = set()
+        self._hits = 0
+        self._writes = 0
+        self._purged = 0
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._validate()
+
+    @classmethod
+    def from_config(cls, db_path: str, cluster: str, rules_csv: str) -> "DiskCache":
+        """Build from SMM_DISK_CACHE_* settings, e.g. ``api/v1/admin/brokers=3600``."""
+        return cls(db_path, cluster, parse_rules(rules_csv))
+
+    def _validate(self) -> None:
+        """Create the schema and drop rows that are expired or from an old layout."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+            )
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE name = 'schema_version'"
+            ).fetchone()
+            if row is None or int(row[0]) != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "cluster TEXT, key TEXT, path TEXT, body TEXT, stored_at REAL, "
+                "PRIMARY KEY (cluster, key))"
+            )
+            rows = self._conn.execute(
+                "SELECT key, path, stored_at FROM entries WHERE cluster = ?",
+                (self.cluster,),
+            ).fetchall()
+            now = time.time()
+            stale = []
+            for key, path, stored_at in rows:
+                ttl = self.ttl_for(path)
+                if ttl <= 0 or now - stored_at > ttl:
+                    stale.append((self.cluster, key))
+            self._conn.executemany(
+                "DELETE FROM entries WHERE cluster = ? AND key = ?", stale
+            )
+            self._purged += len(stale)
+
+    def ttl_for(self, path: str) -> float:
+        return match_rule(self.ttl_rules, path, 0.0)
+
+    def wants(self, key: Hashable, path: str) -> bool:
+        """Cheap in-memory check run before touching the database."""
+        return self.ttl_for(path) > 0 and _key(key) not in self._refreshed
+
+    def lookup(self, key: Hashable, path: str) -> Optional[CacheHit]:
+        if not self.wants(key, path):
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM entries WHERE cluster = ? AND key = ?",
+                (self.cluster, _key(key)),
+            ).fetchone()
+        if row is None:
+            return None
+        body, stored_at = row
+        age = time.time() - stored_at
+        if age > self.ttl_for(path):
+            return None
+        try:
+            value = json.loads(body)
+        except ValueError:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE cluster = ? AND key = ?",
+                    (self.cluster, _key(key)),
+                )
+            return None
+        self._hits += 1
+        return CacheHit(value, age, True)
+
+    def put(self, key: Hashable, path: str, value: Any) -> None:
+        if self.ttl_for(path) <= 0:
+            return
+        encoded_key = _key(key)
+        body = json.dumps(value, separators=(",", ":"), default=str)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (self.cluster, encoded_key, path.lstrip("/"), body, time.time()),
+            )
+            self._refreshed.add(encoded_key)
+            self._writes += 1
+
+    def invalidate(self, patterns: List[str]) -> int:
+        """Delete stored entries whose request path matches any glob pattern."""
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT key, path FROM entries WHERE cluster = ?", (self.cluster,)
+            ).fetchall()
+            doomed = [
+                (self.cluster, key)
+                for key, path in rows
+                if any(fnmatchcase(path, pattern) for pattern in patterns)
+            ]
+            self._conn.executemany(
+                "DELETE FROM entries WHERE cluster = ? AND key = ?", doomed
+            )
+            return len(doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.db_path,
+            "hits": self._hits,
+            "writes": self._writes,
+            "purged_on_startup": self._purged,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _key(key: Hashable) -> str:
+    return json.dumps(key, default=str)
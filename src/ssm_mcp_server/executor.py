@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from .cancel import CANCEL_TOKEN, CancelToken
+
+
+class WorkerPool:
+    """Bounded thread pool for running the blocking SMMClient off the event loop.
+
+    Calls beyond ``max_workers`` wait in the executor queue; queue depth and
+    time spent waiting for a worker are tracked so pool sizing can be tuned.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="smm-worker"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._cancelled = 0
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        submitted = time.monotonic()
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        def _call() -> Any:
+            waited = time.monotonic() - submitted
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        # Carry context variables (per-call options) into the worker thread,
+        # plus a token that lets a cancelled call abort its blocking I/O
+        token = CancelToken()
+        ctx = contextvars.copy_context()
+        ctx.run(CANCEL_TOKEN.set, token)
+        future = self._executor.submit(ctx.run, _call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            token.cancel()
+            # A call that never started leaves the queue without reaching _call
+            never_started = future.cancel()
+            with self._lock:
+                self._cancelled += 1
+                if never_started:
+                    self._queued -= 1
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            started = self._completed + self._active
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "active": self._active,
+                "max_queue_depth": self._max_queue_depth,
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+                "avg_wait_seconds": self._total_wait / started if started else 0.0,
+                "max_wait_seconds": self._max_wait,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from fnmatch import fnmatchcase
+from typing import Any, Deque, Dict, List, Optional
+
+from .retry import RETRYABLE_STATUSES, RetryBudget
+
+# Cheap, latency-sensitive reads: brokers, topic offsets and single consumer groups
+DEFAULT_HEDGE_PATHS = (
+    "api/v1/admin/brokers,"
+    "api/v1/admin/topics/*/offsets,"
+    "topicConsumption/topicOffsets/*,"
+    "api/v1/admin/consumers/*"
+)
+
+
+def answered(resp: Any) -> bool:
+    """Whether a response settles a hedged race (an error status does not)."""
+    return resp.status_code not in RETRYABLE_STATUSES
+
+
+class HedgePolicy:
+    """Decides when an idempotent GET gets a second, racing copy.
+
+    A hedge is sent once the first copy has been outstanding longer than
+    the p95 latency recently observed for its path glob (``initial_delay``
+    until ``min_samples`` are known), and only while the hedge budget
+    allows: each eligible request deposits ``max_ratio`` tokens and each
+    hedge spends one, so hedging adds at most that fraction of extra load.
+    """
+
+    def __init__(
+        self,
+        patterns: List[str],
+        max_ratio: float = 0.05,
+        min_delay: float = 0.05,
+        initial_delay: float = 1.0,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.patterns = patterns
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = RetryBudget(ratio=max_ratio, min_per_second=0.0, max_tokens=5.0)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    @classmethod
+    def from_config(cls, patterns_csv: str, max_ratio: float) -> "HedgePolicy":
+        """Build from SMM_HEDGE_* settings, e.g. ``api/v1/admin/brokers,api/v1/admin/consumers/*``."""
+        patterns = [p.strip().lstrip("/") for p in patterns_csv.split(",") if p.strip()]
+        return cls(patterns, max_ratio=max_ratio)
+
+    def pattern_for(self, method: str, path: str) -> Optional[str]:
+        """The glob a request is hedged under, or None if it must not be hedged."""
+        if method.upper() != "GET":
+            return None
+        path = path.lstrip("/").split("?", 1)[0]
+        for pattern in self.patterns:
+            if fnmatchcase(path, pattern):
+                return pattern
+        return None
+
+    def on_request(self) -> None:
+        self.budget.on_request()
+
+    def delay_for(self, pattern: str) -> float:
+        with self._lock:
+            samples = sorted(self._latencies.get(pattern, ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, samples[int(len(samples) * 0.95) - 1])
+
+    def try_hedge(self) -> bool:
+        if not self.budget.try_spend():
+            return False
+        with self._lock:
+            self._hedged += 1
+        return True
+
+    def observe(self, pattern: str, seconds: float, hedge_won: bool = False) -> None:
+        with self._lock:
+            samples = self._latencies.get(pattern)
+            if samples is None:
+                samples = self._latencies[pattern] = deque(maxlen=self.window)
+            samples.append(seconds)
+            if hedge_won:
+                self._hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        delays = {pattern: round(self.delay_for(pattern), 3) for pattern in self.patterns}
+        budget = self.budget.stats()
+        with self._lock:
+            return {
+                "eligible_requests": budget["requests"],
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+                "budget_exhausted": budget["exhausted"],
+                "delay_seconds": delays,
+            }
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .cancel import CallCancelled, cancellable_sleep
+from .deadline import DeadlineExceeded, fits
+
+
+def endpoint_family(path: str) -> str:
+    """Classify an SMM path into a rate-limit family: metrics, content or admin."""
+    p = path.lstrip("/").lower()
+    if "metrics" in p or p.startswith("etelatency"):
+        return "metrics"
+    if (
+        p.startswith("topicconsumption/")
+        or "/messages" in p
+        or p.endswith("/sample")
+    ):
+        return "content"
+    return "admin"
+
+
+class TokenBucket:
+    """Token bucket safe to share between threads and asyncio tasks.
+
+    Tokens are reserved under a lock and the caller sleeps outside it, so
+    waiters are served in arrival order without holding the lock.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._deadline_rejections = 0
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self._acquired += 1
+            if wait > 0:
+                self._throttled += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def _unreserve(self) -> None:
+        """Give back a reserved token whose request won't be sent."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def _reserve_in_time(self) -> float:
+        wait = self._reserve()
+        if wait > 0 and not fits(wait):
+            # The token would arrive after the tool call's deadline
+            self._unreserve()
+            with self._lock:
+                self._deadline_rejections += 1
+            raise DeadlineExceeded("waiting for the rate limiter")
+        return wait
+
+    def acquire(self) -> float:
+        wait = self._reserve_in_time()
+        if wait > 0:
+            try:
+                cancellable_sleep(wait)
+            except CallCancelled:
+                self._unreserve()
+                raise
+        return wait
+
+    async def acquire_async(self) -> float:
+        wait = self._reserve_in_time()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._unreserve()
+                raise
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.capacity,
+                "acquired": self._acquired,
+                "throttled": self._throttled,
+                "total_wait_seconds": self._total_wait,
+                "max_wait_seconds": self._max_wait,
+                "deadline_rejections": self._deadline_rejections,
+            }
+
+
+class RateLimiter:
+    """Global request budget plus optional per-endpoint-family budgets."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        family_rates: Optional[Dict[str, float]] = None,
+    ):
+        self.global_bucket = TokenBucket(rate, burst) if rate > 0 else None
+        self.family_buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(family_rate, max(1.0, family_rate))
+            for family, family_rate in (family_rates or {}).items()
+            if family_rate > 0
+        }
+
+    @classmethod
+    def from_config(cls, rate: float, burst: float, families_csv: str) -> "RateLimiter":
+        """Build from HTTP_RATE_LIMIT_* settings, e.g. ``metrics=2,content=1``."""
+        family_rates: Dict[str, float] = {}
+        for item in families_csv.split(","):
+            if "=" not in item:
+                continue
+            family, _, value = item.partition("=")
+            family_rates[family.strip().lower()] = float(value)
+        return cls(rate, burst, family_rates)
+
+    def acquire(self, path: str) -> float:
+        waited = 0.0
+        bucket = self.family_buckets.get(endpoint_family(path))
+        if bucket is not None:
+            waited += bucket.acquire()
+        if self.global_bucket is not None:
+            waited += self.global_bucket.acquire()
+        return waited
+
+    async def acquire_async(self, path: str) -> float:
+        waited = 0.0
+        bucket = self.family_buckets.get(endpoint_family(path))
+        if bucket is not None:
+            waited += await bucket.acquire_async()
+        if self.global_bucket is not None:
+            waited += await self.global_bucket.acquire_async()
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "global": self.global_bucket.stats() if self.global_bucket else None,
+            "families": {
+                family: bucket.stats() for family, bucket in self.family_buckets.items()
+            },
+        }
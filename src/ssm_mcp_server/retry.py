@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import requests
+
+# Statuses worth another attempt for an idempotent request
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Failures where the request provably never reached SMM, so even a POST is safe to resend
+_CONNECT_ERRORS = (requests.ConnectTimeout, httpx.ConnectError, httpx.ConnectTimeout)
+_TRANSPORT_ERRORS = (requests.ConnectionError, requests.Timeout, httpx.TransportError)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryBudget:
+    """Process-wide cap on retries as a fraction of first attempts.
+
+    Every first attempt deposits ``ratio`` tokens and every retry spends one,
+    so retries add at most ``ratio`` extra load once traffic is flowing. A
+    trickle of ``min_per_second`` tokens keeps retries possible while idle;
+    the balance never exceeds ``max_tokens``.
+    """
+
+    def __init__(
+        self, ratio: float = 0.1, min_per_second: float = 1.0, max_tokens: float = 10.0
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+        self._exhausted = 0
+
+    def _refill(self, deposit: float) -> None:
+        now = time.monotonic()
+        earned = (now - self._updated) * self.min_per_second + deposit
+        self._tokens = min(self.max_tokens, self._tokens + earned)
+        self._updated = now
+
+    def on_request(self) -> None:
+        with self._lock:
+            self._requests += 1
+            self._refill(self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            self._refill(0.0)
+            if self._tokens < 1.0:
+                self._exhausted += 1
+                return False
+            self._tokens -= 1.0
+            self._retries += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ratio": self.ratio,
+                "tokens": round(self._tokens, 2),
+                "requests": self._requests,
+                "retries": self._retries,
+                "exhausted": self._exhausted,
+            }
+
+
+class RetryPolicy:
+    """Classifies failed SMM attempts and picks the delay before the next one.
+
+    Auth failures and other 4xx answers are returned at once. Idempotent
+    requests are retried on 429/5xx and transport errors; POSTs only when
+    the connection was never established. A ``Retry-After`` header sets the
+    delay (requests asking for more than ``max_retry_after`` are not
+    retried), otherwise exponential backoff with jitter is used.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        budget: Optional[RetryBudget] = None,
+        base_delay: float = 0.5,
+        max_delay: float = 5.0,
+        max_retry_after: float = 30.0,
+    ):
+        self.max_retries = max(0, max_retries)
+        self.budget = budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._not_retried = 0
+
+    def on_request(self) -> None:
+        """Record a first attempt (funds the retry budget)."""
+        if self.budget is not None:
+            self.budget.on_request()
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying, or None to give up after ``attempt``."""
+        if response is not None:
+            if response.status_code not in RETRYABLE_STATUSES:
+                return None
+            retryable = method.upper() in IDEMPOTENT_METHODS
+        else:
+            if isinstance(error, _CONNECT_ERRORS):
+                retryable = True
+            else:
+                retryable = isinstance(error, _TRANSPORT_ERRORS) and (
+                    method.upper() in IDEMPOTENT_METHODS
+                )
+        if not retryable or attempt > self.max_retries:
+            return self._give_up()
+        retry_after = None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return self._give_up()
+        if self.budget is not None and not self.budget.try_spend():
+            return self._give_up()
+        with self._lock:
+            self._retries += 1
+        if retry_after is not None:
+            return retry_after
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(backoff / 2, backoff)
+
+    def _give_up(self) -> None:
+        with self._lock:
+            self._not_retried += 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "max_retries": self.max_retries,
+                "retries": self._retries,
+                "failures_not_retried": self._not_retried,
+            }
+        if self.budget is not None:
+            stats["budget"] = self.budget.stats()
+        return stats
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+SCHEMA_KINDS = ("key", "value")
+
+
+def _version_infos(response: Any) -> List[Dict[str, Any]]:
+    """Normalise a version-info listing (bare list or ``{"entities": [...]}``)."""
+    if isinstance(response, dict):
+        response = response.get("entities", [])
+    if not isinstance(response, list):
+        return []
+    return [
+        info
+        for info in response
+        if isinstance(info, dict) and isinstance(info.get("version"), int)
+    ]
+
+
+class SchemaVersionStore:
+    """Never-expiring store of registered schema versions.
+
+    A schema version cannot change once registered, so versions are keyed
+    by (topic, "key"/"value", version) and kept for the life of the process.
+    Schema texts are content addressed by SHA-256, so topics sharing a schema
+    hold one copy. Only the set of versions moves; callers re-list a subject
+    when ``is_current`` says the last check is older than ``latest_ttl``.
+    """
+
+    def __init__(self, latest_ttl: float = 30.0):
+        self.latest_ttl = latest_ttl
+        self._versions: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
+        self._latest: Dict[Tuple[str, str], int] = {}
+        self._checked_at: Dict[Tuple[str, str], float] = {}
+        self._texts: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def record(self, topic: str, kind: str, response: Any) -> None:
+        """Index every version in a version-info listing."""
+        with self._lock:
+            for info in _version_infos(response):
+                entry = dict(info)
+                text = entry.pop("schemaText", None)
+                if isinstance(text, str):
+                    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+                    self._texts.setdefault(digest, text)
+                    entry["schemaTextDigest"] = digest
+                version = info["version"]
+                self._versions[(topic, kind, version)] = entry
+                if version > self._latest.get((topic, kind), 0):
+                    self._latest[(topic, kind)] = version
+
+    def checked(self, topic: str, kind: str) -> None:
+        """Note that the subject's version list was just read from SMM."""
+        with self._lock:
+            self._checked_at[(topic, kind)] = time.monotonic()
+
+    def is_current(self, topic: str, kind: str) -> bool:
+        checked_at = self._checked_at.get((topic, kind))
+        return checked_at is not None and time.monotonic() - checked_at < self.latest_ttl
+
+    def get(self, topic: str, kind: str, version: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._versions.get((topic, kind, version))
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            info = dict(entry)
+            # The digest is ours; hand back the fields SMM sent
+            digest = info.pop("schemaTextDigest", None)
+            if digest is not None:
+                info["schemaText"] = self._texts[digest]
+            return info
+
+    def latest(self, topic: str, kind: str) -> Optional[int]:
+        return self._latest.get((topic, kind))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "versions": len(self._versions),
+                "distinct_schema_texts": len(self._texts),
+                "subjects": len(self._latest),
+                "latest_ttl_seconds": self.latest_ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
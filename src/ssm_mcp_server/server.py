@@ -1,18 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import os
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Union
 
 import anyio
 
 from .config import ServerConfig
 from .auth import KnoxAuthFactory
 from .client import SMMClient
+from .async_client import AsyncSMMClient
+from .capabilities import CapabilityMap, EndpointUnsupportedError
+from .cache import BYPASS_CACHE, DATA_AGE, DataAge, ResponseCache
+from .catalog import BrokerCatalog, TopicCatalog
+from .circuit import CircuitBreaker, CircuitOpenError
+from .codec import JsonCodec, resolve_codec
+from .concurrency import AdaptiveLimiter
+from .deadline import DEADLINE, DeadlineExceeded, DeadlinePolicy
+from .disk_cache import DiskCache
+from .executor import WorkerPool
+from .hedge import HedgePolicy
+from .ratelimit import RateLimiter
+from .retry import RetryBudget, RetryPolicy
+from .schema_cache import SchemaVersionStore
+from .singleflight import SingleFlight
+from .token_cache import TokenCache
+from .transport import configure_session
 
 
 # Lazy import of MCP to give a clear error if the dependency is missing
 try:
     from mcp.server import FastMCP
+    from mcp.types import CallToolResult, TextContent
 except Exception as e:  # pragma: no cover
     raise RuntimeError(
         "The 'mcp' package is required. Install with: pip install mcp"
@@ -46,11 +68,67 @@ def _redact_sensitive(obj: Any, max_items: int = 200) -> Any:
     return obj
 
 
-def _handle_smm_operation(operation_func, *args, **kwargs) -> Dict[str, Any]:
+async def _maybe_await(value: Any) -> Any:
+    """Resolve results from either the sync or the async SMM client."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _run_smm_call(
+    operation_func, *args, worker_pool: Optional[WorkerPool] = None, **kwargs
+) -> Any:
+    """Run an SMM call inline, or on the worker pool when one is configured."""
+    if worker_pool is not None:
+        return await _maybe_await(
+            await worker_pool.run(operation_func, *args, **kwargs)
+        )
+    return await _maybe_await(operation_func(*args, **kwargs))
+
+
+def _encoded_result(data: Any, codec: Optional[JsonCodec]) -> Any:
+    """Encode a dict result once with ``codec`` instead of FastMCP's indented pydantic dump."""
+    if codec is None or not isinstance(data, dict):
+        return data
+    return CallToolResult(
+        content=[TextContent(type="text", text=codec.dumps(data))],
+        # Same shape FastMCP gives a Dict[str, Any] return value
+        structuredContent={"result": data},
+    )
+
+
+async def _handle_smm_operation(
+    operation_func,
+    *args,
+    worker_pool: Optional[WorkerPool] = None,
+    codec: Optional[JsonCodec] = None,
+    deadlines: Optional[DeadlinePolicy] = None,
+    deadline_seconds: Optional[float] = None,
+    fresh: bool = False,
+    report_age: bool = False,
+    **kwargs,
+) -> Any:
     """Handle SMM operations with proper error handling and redaction."""
+    if deadlines is not None:
+        deadline_seconds = deadlines.seconds_for(
+            getattr(operation_func, "__name__", ""), deadline_seconds
+        )
+    deadline_token = DEADLINE.set(
+        time.monotonic() + deadline_seconds if deadline_seconds else None
+    )
+    bypass_token = BYPASS_CACHE.set(fresh)
+    data_age = DataAge()
+    age_token = DATA_AGE.set(data_age)
     try:
-        data = operation_func(*args, **kwargs)
-        return _redact_sensitive(data)
+        data = await _run_smm_call(
+            operation_func, *args, worker_pool=worker_pool, **kwargs
+        )
+        data = _redact_sensitive(data)
+        if report_age:
+            if not isinstance(data, dict):
+                data = {"data": data}
+            data["data_age_seconds"] = round(data_age.seconds or 0.0, 3)
+        return _encoded_result(data, codec)
     except Exception as e:
         # Return error information in a structured format that Claude can understand
         error_response = {
@@ -59,12 +137,25 @@ def _handle_smm_operation(operation_func, *args, **kwargs) -> Dict[str, Any]:
             "error_message": str(e),
             "message": f"Operation failed: {str(e)}",
         }
-        return error_response
-
-
-def build_client(config: ServerConfig) -> SMMClient:
+        if isinstance(e, CircuitOpenError):
+            error_response["endpoint_template"] = e.template
+            error_response["retry_in_seconds"] = round(e.retry_in, 1)
+        elif isinstance(e, EndpointUnsupportedError):
+            error_response["unsupported_endpoint"] = e.path
+            error_response["capability"] = e.capability
+        elif isinstance(e, DeadlineExceeded):
+            error_response["deadline_seconds"] = deadline_seconds
+        return _encoded_result(error_response, codec)
+    finally:
+        DATA_AGE.reset(age_token)
+        BYPASS_CACHE.reset(bypass_token)
+        DEADLINE.reset(deadline_token)
+
+
+def build_client(config: ServerConfig) -> Union[SMMClient, AsyncSMMClient]:
     verify = config.build_verify()
     smm_base = config.build_smm_base()
+    pool = config.build_pool()
 
     # Use Knox authentication if Knox is configured, otherwise use direct SMM authentication
     if config.knox_gateway_url:
@@ -77,27 +168,121 @@ def build_client(config: ServerConfig) -> SMMClient:
             token_endpoint=config.knox_token_endpoint,
             passcode_token=config.knox_passcode_token,
             verify=verify,
+            pool=pool,
+            connect_timeout=config.connect_timeout_seconds,
+            refresh_margin=config.knox_refresh_margin_seconds,
+            token_cache=TokenCache(config.knox_token_cache_path)
+            if config.knox_token_cache_path
+            else None,
         )
         session = auth.build_session()
+        token_refresher = auth.refresher
     else:
         # Direct SMM authentication
         import requests
 
-        session = requests.Session()
+        session = configure_session(requests.Session(), pool)
         session.verify = verify
+        token_refresher = None
         if config.smm_user and config.smm_password:
             session.auth = (config.smm_user, config.smm_password)
 
-    return SMMClient(
+    concurrency_limiter = None
+    if config.adaptive_concurrency:
+        concurrency_limiter = AdaptiveLimiter(
+            initial_limit=config.concurrency_initial,
+            min_limit=config.concurrency_min,
+            max_limit=config.concurrency_max,
+        )
+
+    disk_cache = None
+    if config.disk_cache_path:
+        disk_cache = DiskCache.from_config(
+            config.disk_cache_path, smm_base, config.disk_cache_rules_csv
+        )
+
+    client_options: Dict[str, Any] = {}
+    if config.client_mode == "async":
+        client_cls = AsyncSMMClient
+        client_options["pool"] = pool
+        client_options["http2"] = config.http2
+    else:
+        if config.http2:
+            raise ValueError("HTTP_HTTP2 requires SMM_CLIENT_MODE=async")
+        client_cls = SMMClient
+    return client_cls(
         smm_base,
         session,
-        timeout_seconds=config.timeout_seconds,
+        timeout_seconds=config.build_read_timeout(),
+        connect_timeout_seconds=config.connect_timeout_seconds,
         proxy_context_path=config.proxy_context_path,
+        rate_limiter=RateLimiter.from_config(
+            config.rate_limit_rps,
+            config.rate_limit_burst,
+            config.rate_limit_families_csv,
+        ),
+        concurrency_limiter=concurrency_limiter,
+        single_flight=SingleFlight() if config.coalesce_gets else None,
+        cache=ResponseCache.from_config(
+            config.cache_max_entries,
+            config.cache_max_bytes,
+            config.cache_default_ttl,
+            config.cache_ttls_csv,
+            config.cache_stale_csv,
+        )
+        if config.cache_enabled
+        else None,
+        topic_catalog=TopicCatalog(ttl_seconds=config.topic_catalog_ttl),
+        broker_catalog=BrokerCatalog(ttl_seconds=config.broker_catalog_ttl),
+        disk_cache=disk_cache,
+        schema_store=SchemaVersionStore(latest_ttl=config.schema_latest_ttl),
+        retry_policy=RetryPolicy(
+            max_retries=config.max_retries,
+            budget=RetryBudget(ratio=config.retry_budget_ratio),
+            max_retry_after=config.retry_max_after_seconds,
+        ),
+        circuit_breaker=CircuitBreaker.from_config(
+            config.circuit_templates_csv,
+            config.circuit_failure_threshold,
+            config.circuit_reset_seconds,
+            config.circuit_resource_paths_csv,
+        )
+        if config.circuit_breaker
+        else None,
+        capabilities=CapabilityMap(
+            smm_base,
+            store_path=config.capability_map_path,
+            ttl_seconds=config.capability_map_ttl,
+        ),
+        codec=resolve_codec(config.json_codec),
+        hedge_policy=HedgePolicy.from_config(config.hedge_paths_csv, config.hedge_max_ratio)
+        if config.hedge_requests
+        else None,
+        token_refresher=token_refresher,
+        **client_options,
     )
 
 
-def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
+def build_worker_pool(config: ServerConfig) -> Optional[WorkerPool]:
+    # Only the blocking client needs to be moved off the event loop
+    if config.client_mode != "threaded":
+        return None
+    return WorkerPool(max_workers=config.worker_pool_size)
+
+
+def create_server(
+    smm: Union[SMMClient, AsyncSMMClient],
+    readonly: bool,
+    worker_pool: Optional[WorkerPool] = None,
+    deadlines: Optional[DeadlinePolicy] = None,
+) -> FastMCP:
     app = FastMCP("ssm-mcp-server")
+    handle = functools.partial(
+        _handle_smm_operation,
+        worker_pool=worker_pool,
+        codec=smm.codec,
+        deadlines=deadlines,
+    )
 
     # ============================================================================
     # Core Information Tools
@@ -106,33 +291,60 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
     @app.tool()
     async def get_smm_info() -> Dict[str, Any]:
         """Get SMM version and system information."""
-        data = smm.get_smm_info()
+        data = await _run_smm_call(smm.get_smm_info, worker_pool=worker_pool)
         return _redact_sensitive(data)
 
     @app.tool()
     async def get_smm_version() -> Dict[str, Any]:
         """Get SMM version information."""
-        data = smm.get_smm_version()
+        data = await _run_smm_call(smm.get_smm_version, worker_pool=worker_pool)
         return _redact_sensitive(data)
 
+    @app.tool()
+    async def get_server_stats() -> Dict[str, Any]:
+        """Get MCP server and SMM client statistics (queueing, limits, caching)."""
+        stats: Dict[str, Any] = smm.stats()
+        if worker_pool is not None:
+            stats["worker_pool"] = worker_pool.stats()
+        return stats
+
+    @app.tool()
+    async def probe_endpoints(
+        refresh: bool = True, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Probe which SMM endpoints this cluster serves. Later calls use the working path variant and unsupported endpoints fail instantly."""
+        return await handle(
+            smm.probe_capabilities, refresh, deadline_seconds=deadline_seconds
+        )
+
     # ============================================================================
     # Cluster and Broker Management Tools
     # ============================================================================
 
     @app.tool()
-    async def get_cluster_details() -> Dict[str, Any]:
+    async def get_cluster_details(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get cluster details and information."""
-        return _handle_smm_operation(smm.get_cluster_details)
+        return await handle(smm.get_cluster_details, deadline_seconds=deadline_seconds)
 
     @app.tool()
-    async def get_brokers() -> Dict[str, Any]:
-        """Get all brokers in the cluster."""
-        return _handle_smm_operation(smm.get_brokers)
+    async def get_brokers(
+        fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get all brokers in the cluster. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_brokers, fresh=fresh, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_broker(broker_id: int) -> Dict[str, Any]:
-        """Get details of a specific broker."""
-        return _handle_smm_operation(smm.get_broker, broker_id)
+    async def get_broker(
+        broker_id: int, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get details of a specific broker. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_broker, broker_id, fresh=fresh, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
     async def get_broker_metrics(
@@ -140,145 +352,289 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get metrics for a specific broker."""
-        return _handle_smm_operation(
-            smm.get_broker_metrics, broker_id, duration, from_time, to_time
+        return await handle(
+            smm.get_broker_metrics,
+            broker_id,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
-    async def get_all_broker_details() -> Dict[str, Any]:
+    async def get_all_broker_details(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get all broker details with configurations."""
-        return _handle_smm_operation(smm.get_all_broker_details)
+        return await handle(
+            smm.get_all_broker_details, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_broker_details(broker_id: int) -> Dict[str, Any]:
+    async def get_broker_details(
+        broker_id: int, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get detailed broker information including configuration."""
-        return _handle_smm_operation(smm.get_broker_details, broker_id)
+        return await handle(
+            smm.get_broker_details, broker_id, deadline_seconds=deadline_seconds
+        )
 
     # ============================================================================
     # Topic Management Tools
     # ============================================================================
 
     @app.tool()
-    async def get_all_topic_infos() -> Dict[str, Any]:
-        """Get all topic information."""
-        return _handle_smm_operation(smm.get_all_topic_infos)
+    async def get_all_topic_infos(
+        fields: Optional[List[str]] = None,
+        fresh: bool = False,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get all topic information. Pass fields (e.g. ["name", "partitions"]) to return only those keys of each topic. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_all_topic_infos,
+            fields,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_topic_description(topic_name: str) -> Dict[str, Any]:
-        """Get detailed description of a specific topic."""
-        return _handle_smm_operation(smm.get_topic_description, topic_name)
+    async def get_topic_description(
+        topic_name: str, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get detailed description of a specific topic. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_topic_description,
+            topic_name,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_topic_info(topic_name: str) -> Dict[str, Any]:
-        """Get basic information about a specific topic."""
-        return _handle_smm_operation(smm.get_topic_info, topic_name)
+    async def find_topics(
+        prefix: str, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Find topic names starting with a prefix. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.find_topics, prefix, fresh=fresh, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_topic_partitions(topic_name: str) -> Dict[str, Any]:
-        """Get partition information for a specific topic."""
-        return _handle_smm_operation(smm.get_topic_partitions, topic_name)
+    async def get_topic_info(
+        topic_name: str, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get basic information about a specific topic. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_topic_info,
+            topic_name,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_topic_partition_infos(topic_name: str) -> Dict[str, Any]:
+    async def get_topic_partitions(
+        topic_name: str, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get partition information for a specific topic. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_topic_partitions,
+            topic_name,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
+
+    @app.tool()
+    async def get_topic_partition_infos(
+        topic_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get detailed partition information for a specific topic."""
-        return _handle_smm_operation(smm.get_topic_partition_infos, topic_name)
+        return await handle(
+            smm.get_topic_partition_infos, topic_name, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_topic_configs(topic_name: str) -> Dict[str, Any]:
-        """Get configuration for a specific topic."""
-        return _handle_smm_operation(smm.get_topic_configs, topic_name)
+    async def get_topic_configs(
+        topic_name: str, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get configuration for a specific topic. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_topic_configs,
+            topic_name,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_all_topic_configs() -> Dict[str, Any]:
-        """Get configurations for all topics."""
-        return _handle_smm_operation(smm.get_all_topic_configs)
+    async def get_all_topic_configs(
+        fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get configurations for all topics. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_all_topic_configs, fresh=fresh, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_default_topic_configs() -> Dict[str, Any]:
+    async def get_default_topic_configs(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get default topic configurations."""
-        return _handle_smm_operation(smm.get_default_topic_configs)
+        return await handle(
+            smm.get_default_topic_configs, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_topic_offsets(topic_name: str) -> Dict[str, Any]:
-        """Get offset information for a topic."""
-        return _handle_smm_operation(smm.get_topic_offsets, topic_name)
+    async def get_topic_offsets(
+        topic_name: str, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get offset information for a topic. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_topic_offsets,
+            topic_name,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
     async def get_topic_content(
-        topic_name: str, partition: int, offset: int, limit: int = 10
+        topic_name: str,
+        partition: int,
+        offset: int,
+        limit: int = 10,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get content from a topic partition."""
-        return _handle_smm_operation(
-            smm.get_topic_content, topic_name, partition, offset, limit
+        return await handle(
+            smm.get_topic_content,
+            topic_name,
+            partition,
+            offset,
+            limit,
+            deadline_seconds=deadline_seconds,
         )
 
     # Write operations (only available if not in readonly mode)
     if not readonly:
 
         @app.tool()
-        async def create_topics(topics_config: List[Dict[str, Any]]) -> Dict[str, Any]:
+        async def create_topics(
+            topics_config: List[Dict[str, Any]],
+            deadline_seconds: Optional[float] = None,
+        ) -> Dict[str, Any]:
             """Create new topics."""
-            return _handle_smm_operation(smm.create_topics, topics_config)
+            return await handle(
+                smm.create_topics, topics_config, deadline_seconds=deadline_seconds
+            )
 
         @app.tool()
         async def create_partitions(
-            topic_name: str, partition_count: int
+            topic_name: str,
+            partition_count: int,
+            deadline_seconds: Optional[float] = None,
         ) -> Dict[str, Any]:
             """Create additional partitions for a topic."""
-            return _handle_smm_operation(
-                smm.create_partitions, topic_name, partition_count
+            return await handle(
+                smm.create_partitions,
+                topic_name,
+                partition_count,
+                deadline_seconds=deadline_seconds,
             )
 
         @app.tool()
-        async def delete_topics(topic_names: List[str]) -> Dict[str, Any]:
+        async def delete_topics(
+            topic_names: List[str], deadline_seconds: Optional[float] = None
+        ) -> Dict[str, Any]:
             """Delete specified topics."""
-            return _handle_smm_operation(smm.delete_topics, topic_names)
+            return await handle(
+                smm.delete_topics, topic_names, deadline_seconds=deadline_seconds
+            )
 
         @app.tool()
         async def alter_topic_configs(
-            topic_name: str, configs: Dict[str, str]
+            topic_name: str,
+            configs: Dict[str, str],
+            deadline_seconds: Optional[float] = None,
         ) -> Dict[str, Any]:
             """Alter topic configurations."""
-            return _handle_smm_operation(smm.alter_topic_configs, topic_name, configs)
+            return await handle(
+                smm.alter_topic_configs,
+                topic_name,
+                configs,
+                deadline_seconds=deadline_seconds,
+            )
 
     # ============================================================================
     # Consumer Group Management Tools
     # ============================================================================
 
     @app.tool()
-    async def get_consumer_groups() -> Dict[str, Any]:
-        """Get all consumer groups."""
-        return _handle_smm_operation(smm.get_consumer_groups)
+    async def get_consumer_groups(
+        fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get all consumer groups. May be served from a recent snapshot; data_age_seconds reports its age. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_consumer_groups,
+            fresh=fresh,
+            report_age=True,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_consumer_group_names() -> Dict[str, Any]:
+    async def get_consumer_group_names(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get all consumer group names."""
-        return _handle_smm_operation(smm.get_consumer_group_names)
+        return await handle(
+            smm.get_consumer_group_names, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_consumer_group_info(group_name: str) -> Dict[str, Any]:
-        """Get detailed information about a specific consumer group."""
-        return _handle_smm_operation(smm.get_consumer_group_info, group_name)
+    async def get_consumer_group_info(
+        group_name: str, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get detailed information about a specific consumer group. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_consumer_group_info,
+            group_name,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_all_consumer_info() -> Dict[str, Any]:
-        """Get information about all consumers."""
-        return _handle_smm_operation(smm.get_all_consumer_info)
+    async def get_all_consumer_info(
+        fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get information about all consumers. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_all_consumer_info, fresh=fresh, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_consumer_info(consumer_id: str) -> Dict[str, Any]:
+    async def get_consumer_info(
+        consumer_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get information about a specific consumer."""
-        return _handle_smm_operation(smm.get_consumer_info, consumer_id)
+        return await handle(
+            smm.get_consumer_info, consumer_id, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
     async def reset_offset(
-        group_name: str, topic_name: str, partition: int, offset: int
+        group_name: str,
+        topic_name: str,
+        partition: int,
+        offset: int,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Reset consumer group offset."""
-        return _handle_smm_operation(
-            smm.reset_offset, group_name, topic_name, partition, offset
+        return await handle(
+            smm.reset_offset,
+            group_name,
+            topic_name,
+            partition,
+            offset,
+            deadline_seconds=deadline_seconds,
         )
 
     # ============================================================================
@@ -290,10 +646,15 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get cluster metrics including broker metrics."""
-        return _handle_smm_operation(
-            smm.get_cluster_with_broker_metrics, duration, from_time, to_time
+        return await handle(
+            smm.get_cluster_with_broker_metrics,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
@@ -301,10 +662,17 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Get cluster metrics including topic metrics."""
-        return _handle_smm_operation(
-            smm.get_cluster_with_topic_metrics, duration, from_time, to_time
+        """Get cluster metrics including topic metrics. Pass fields to return only those top-level keys."""
+        return await handle(
+            smm.get_cluster_with_topic_metrics,
+            duration,
+            from_time,
+            to_time,
+            fields,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
@@ -315,9 +683,10 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         state: Optional[str] = None,
         include_producer_metrics: bool = False,
         include_assignments: bool = False,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get metrics for all consumer groups."""
-        return _handle_smm_operation(
+        return await handle(
             smm.get_all_consumer_group_metrics,
             duration,
             from_time,
@@ -325,6 +694,7 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
             state,
             include_producer_metrics,
             include_assignments,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
@@ -333,10 +703,16 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get metrics for a specific consumer group."""
-        return _handle_smm_operation(
-            smm.get_consumer_group_metrics, group_name, duration, from_time, to_time
+        return await handle(
+            smm.get_consumer_group_metrics,
+            group_name,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
@@ -344,10 +720,15 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get metrics for all producers."""
-        return _handle_smm_operation(
-            smm.get_all_producer_metrics, duration, from_time, to_time
+        return await handle(
+            smm.get_all_producer_metrics,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
@@ -356,10 +737,16 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get metrics for a specific producer."""
-        return _handle_smm_operation(
-            smm.get_producer_metrics, producer_id, duration, from_time, to_time
+        return await handle(
+            smm.get_producer_metrics,
+            producer_id,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
@@ -368,10 +755,16 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get metrics for a specific topic."""
-        return _handle_smm_operation(
-            smm.get_topic_metrics, topic_name, duration, from_time, to_time
+        return await handle(
+            smm.get_topic_metrics,
+            topic_name,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
@@ -381,15 +774,17 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get metrics for a specific topic partition."""
-        return _handle_smm_operation(
+        return await handle(
             smm.get_topic_partition_metrics,
             topic_name,
             partition_num,
             duration,
             from_time,
             to_time,
+            deadline_seconds=deadline_seconds,
         )
 
     # ============================================================================
@@ -397,86 +792,131 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
     # ============================================================================
 
     @app.tool()
-    async def get_all_alert_policies() -> Dict[str, Any]:
+    async def get_all_alert_policies(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get all alert policies."""
-        return _handle_smm_operation(smm.get_all_alert_policies)
+        return await handle(
+            smm.get_all_alert_policies, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_alert_policy(policy_id: str) -> Dict[str, Any]:
+    async def get_alert_policy(
+        policy_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get details of a specific alert policy."""
-        return _handle_smm_operation(smm.get_alert_policy, policy_id)
+        return await handle(
+            smm.get_alert_policy, policy_id, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_alert_notifications() -> Dict[str, Any]:
+    async def get_alert_notifications(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get all alert notifications."""
-        return _handle_smm_operation(smm.get_alert_notifications)
+        return await handle(
+            smm.get_alert_notifications, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
     async def get_alert_notifications_by_entity_type(
         entity_type: str,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get alert notifications by entity type."""
-        return _handle_smm_operation(
-            smm.get_alert_notifications_by_entity_type, entity_type
+        return await handle(
+            smm.get_alert_notifications_by_entity_type,
+            entity_type,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
     async def get_alert_notifications_by_entity_type_and_name(
-        entity_type: str, entity_name: str
+        entity_type: str, entity_name: str, deadline_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """Get alert notifications by entity type and name."""
-        return _handle_smm_operation(
+        return await handle(
             smm.get_alert_notifications_by_entity_type_and_name,
             entity_type,
             entity_name,
+            deadline_seconds=deadline_seconds,
         )
 
     # Write operations for alerts (only available if not in readonly mode)
     if not readonly:
 
         @app.tool()
-        async def add_alert_policy(policy_config: Dict[str, Any]) -> Dict[str, Any]:
+        async def add_alert_policy(
+            policy_config: Dict[str, Any], deadline_seconds: Optional[float] = None
+        ) -> Dict[str, Any]:
             """Add a new alert policy."""
-            return _handle_smm_operation(smm.add_alert_policy, policy_config)
+            return await handle(
+                smm.add_alert_policy, policy_config, deadline_seconds=deadline_seconds
+            )
 
         @app.tool()
         async def update_alert_policy(
-            policy_id: str, policy_config: Dict[str, Any]
+            policy_id: str,
+            policy_config: Dict[str, Any],
+            deadline_seconds: Optional[float] = None,
         ) -> Dict[str, Any]:
             """Update an existing alert policy."""
-            return _handle_smm_operation(
-                smm.update_alert_policy, policy_id, policy_config
+            return await handle(
+                smm.update_alert_policy,
+                policy_id,
+                policy_config,
+                deadline_seconds=deadline_seconds,
             )
 
         @app.tool()
-        async def delete_alert_policy(policy_id: str) -> Dict[str, Any]:
+        async def delete_alert_policy(
+            policy_id: str, deadline_seconds: Optional[float] = None
+        ) -> Dict[str, Any]:
             """Delete an alert policy."""
-            return _handle_smm_operation(smm.delete_alert_policy, policy_id)
+            return await handle(
+                smm.delete_alert_policy, policy_id, deadline_seconds=deadline_seconds
+            )
 
         @app.tool()
-        async def enable_alert_policy(policy_id: str) -> Dict[str, Any]:
+        async def enable_alert_policy(
+            policy_id: str, deadline_seconds: Optional[float] = None
+        ) -> Dict[str, Any]:
             """Enable an alert policy."""
-            return _handle_smm_operation(smm.enable_alert_policy, policy_id)
+            return await handle(
+                smm.enable_alert_policy, policy_id, deadline_seconds=deadline_seconds
+            )
 
         @app.tool()
-        async def disable_alert_policy(policy_id: str) -> Dict[str, Any]:
+        async def disable_alert_policy(
+            policy_id: str, deadline_seconds: Optional[float] = None
+        ) -> Dict[str, Any]:
             """Disable an alert policy."""
-            return _handle_smm_operation(smm.disable_alert_policy, policy_id)
+            return await handle(
+                smm.disable_alert_policy, policy_id, deadline_seconds=deadline_seconds
+            )
 
         @app.tool()
         async def mark_alert_notifications(
             notification_ids: List[str],
+            deadline_seconds: Optional[float] = None,
         ) -> Dict[str, Any]:
             """Mark alert notifications as read."""
-            return _handle_smm_operation(smm.mark_alert_notifications, notification_ids)
+            return await handle(
+                smm.mark_alert_notifications,
+                notification_ids,
+                deadline_seconds=deadline_seconds,
+            )
 
         @app.tool()
         async def unmark_alert_notifications(
             notification_ids: List[str],
+            deadline_seconds: Optional[float] = None,
         ) -> Dict[str, Any]:
             """Unmark alert notifications as unread."""
-            return _handle_smm_operation(
-                smm.unmark_alert_notifications, notification_ids
+            return await handle(
+                smm.unmark_alert_notifications,
+                notification_ids,
+                deadline_seconds=deadline_seconds,
             )
 
     # ============================================================================
@@ -484,35 +924,92 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
     # ============================================================================
 
     @app.tool()
-    async def get_schema_registry_info() -> Dict[str, Any]:
+    async def get_schema_registry_info(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get schema registry information."""
-        return _handle_smm_operation(smm.get_schema_registry_info)
+        return await handle(
+            smm.get_schema_registry_info, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_schema_meta_for_topic(topic_name: str) -> Dict[str, Any]:
+    async def get_schema_meta_for_topic(
+        topic_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get schema metadata for a specific topic."""
-        return _handle_smm_operation(smm.get_schema_meta_for_topic, topic_name)
+        return await handle(
+            smm.get_schema_meta_for_topic, topic_name, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_key_schema_version_infos(topic_name: str) -> Dict[str, Any]:
+    async def get_key_schema_version_infos(
+        topic_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get key schema version information for a topic."""
-        return _handle_smm_operation(smm.get_key_schema_version_infos, topic_name)
+        return await handle(
+            smm.get_key_schema_version_infos,
+            topic_name,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_value_schema_version_infos(topic_name: str) -> Dict[str, Any]:
+    async def get_value_schema_version_infos(
+        topic_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get value schema version information for a topic."""
-        return _handle_smm_operation(smm.get_value_schema_version_infos, topic_name)
+        return await handle(
+            smm.get_value_schema_version_infos,
+            topic_name,
+            deadline_seconds=deadline_seconds,
+        )
+
+    @app.tool()
+    async def get_schema_version(
+        topic_name: str,
+        schema_type: str,
+        version: int,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get one registered schema version for a topic; schema_type is "key" or "value"."""
+        return await handle(
+            smm.get_schema_version,
+            topic_name,
+            schema_type,
+            version,
+            deadline_seconds=deadline_seconds,
+        )
+
+    @app.tool()
+    async def get_latest_schema_version(
+        topic_name: str,
+        schema_type: str,
+        fresh: bool = False,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get the latest registered schema version for a topic; schema_type is "key" or "value". Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_latest_schema_version,
+            topic_name,
+            schema_type,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
 
     # Write operations for schema registry (only available if not in readonly mode)
     if not readonly:
 
         @app.tool()
         async def register_topic_schema_meta(
-            topic_name: str, schema_config: Dict[str, Any]
+            topic_name: str,
+            schema_config: Dict[str, Any],
+            deadline_seconds: Optional[float] = None,
         ) -> Dict[str, Any]:
             """Register schema metadata for a topic."""
-            return _handle_smm_operation(
-                smm.register_topic_schema_meta, topic_name, schema_config
+            return await handle(
+                smm.register_topic_schema_meta,
+                topic_name,
+                schema_config,
+                deadline_seconds=deadline_seconds,
             )
 
     # ============================================================================
@@ -520,56 +1017,94 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
     # ============================================================================
 
     @app.tool()
-    async def get_connectors() -> Dict[str, Any]:
+    async def get_connectors(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get all Kafka Connect connectors."""
-        return _handle_smm_operation(smm.get_connectors)
+        return await handle(smm.get_connectors, deadline_seconds=deadline_seconds)
 
     @app.tool()
-    async def get_connector(connector_name: str) -> Dict[str, Any]:
+    async def get_connector(
+        connector_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get details of a specific connector."""
-        return _handle_smm_operation(smm.get_connector, connector_name)
+        return await handle(
+            smm.get_connector, connector_name, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_connector_config_def(connector_name: str) -> Dict[str, Any]:
+    async def get_connector_config_def(
+        connector_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get connector configuration definition."""
-        return _handle_smm_operation(smm.get_connector_config_def, connector_name)
+        return await handle(
+            smm.get_connector_config_def,
+            connector_name,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_connector_permissions(connector_name: str) -> Dict[str, Any]:
+    async def get_connector_permissions(
+        connector_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get connector permissions."""
-        return _handle_smm_operation(smm.get_connector_permissions, connector_name)
+        return await handle(
+            smm.get_connector_permissions,
+            connector_name,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
     async def get_connect_worker_metrics(
         duration: Optional[str] = None,
         from_time: Optional[int] = None,
         to_time: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get Kafka Connect worker metrics."""
-        return _handle_smm_operation(
-            smm.get_connect_worker_metrics, duration, from_time, to_time
+        return await handle(
+            smm.get_connect_worker_metrics,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
         )
 
     # Write operations for Kafka Connect (only available if not in readonly mode)
     if not readonly:
 
         @app.tool()
-        async def create_connector(connector_config: Dict[str, Any]) -> Dict[str, Any]:
+        async def create_connector(
+            connector_config: Dict[str, Any], deadline_seconds: Optional[float] = None
+        ) -> Dict[str, Any]:
             """Create a new connector."""
-            return _handle_smm_operation(smm.create_connector, connector_config)
+            return await handle(
+                smm.create_connector,
+                connector_config,
+                deadline_seconds=deadline_seconds,
+            )
 
         @app.tool()
-        async def delete_connector(connector_name: str) -> Dict[str, Any]:
+        async def delete_connector(
+            connector_name: str, deadline_seconds: Optional[float] = None
+        ) -> Dict[str, Any]:
             """Delete a connector."""
-            return _handle_smm_operation(smm.delete_connector, connector_name)
+            return await handle(
+                smm.delete_connector, connector_name, deadline_seconds=deadline_seconds
+            )
 
         @app.tool()
         async def configure_connector(
-            connector_name: str, config: Dict[str, Any]
+            connector_name: str,
+            config: Dict[str, Any],
+            deadline_seconds: Optional[float] = None,
         ) -> Dict[str, Any]:
             """Configure a connector."""
-            return _handle_smm_operation(
-                smm.configure_connector, connector_name, config
+            return await handle(
+                smm.configure_connector,
+                connector_name,
+                config,
+                deadline_seconds=deadline_seconds,
             )
 
     # ============================================================================
@@ -577,50 +1112,71 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
     # ============================================================================
 
     @app.tool()
-    async def get_topic_lineage(topic_name: str) -> Dict[str, Any]:
+    async def get_topic_lineage(
+        topic_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get lineage information for a topic."""
-        return _handle_smm_operation(smm.get_topic_lineage, topic_name)
+        return await handle(
+            smm.get_topic_lineage, topic_name, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
     async def get_topic_partition_lineage(
-        topic_name: str, partition: int
+        topic_name: str, partition: int, deadline_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """Get lineage information for a topic partition."""
-        return _handle_smm_operation(
-            smm.get_topic_partition_lineage, topic_name, partition
+        return await handle(
+            smm.get_topic_partition_lineage,
+            topic_name,
+            partition,
+            deadline_seconds=deadline_seconds,
         )
 
     @app.tool()
-    async def get_consumer_group_lineage(group_name: str) -> Dict[str, Any]:
+    async def get_consumer_group_lineage(
+        group_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get lineage information for a consumer group."""
-        return _handle_smm_operation(smm.get_consumer_group_lineage, group_name)
+        return await handle(
+            smm.get_consumer_group_lineage,
+            group_name,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_producer_lineage(producer_id: str) -> Dict[str, Any]:
+    async def get_producer_lineage(
+        producer_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get lineage information for a producer."""
-        return _handle_smm_operation(smm.get_producer_lineage, producer_id)
+        return await handle(
+            smm.get_producer_lineage, producer_id, deadline_seconds=deadline_seconds
+        )
 
     # ============================================================================
     # Authentication Tools
     # ============================================================================
 
     @app.tool()
-    async def get_access() -> Dict[str, Any]:
+    async def get_access(deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
         """Get access information."""
-        return _handle_smm_operation(smm.get_access)
+        return await handle(smm.get_access, deadline_seconds=deadline_seconds)
 
     # Write operations for authentication (only available if not in readonly mode)
     if not readonly:
 
         @app.tool()
-        async def login(username: str, password: str) -> Dict[str, Any]:
+        async def login(
+            username: str, password: str, deadline_seconds: Optional[float] = None
+        ) -> Dict[str, Any]:
             """Login to SMM."""
-            return _handle_smm_operation(smm.login, username, password)
+            return await handle(
+                smm.login, username, password, deadline_seconds=deadline_seconds
+            )
 
         @app.tool()
-        async def logout() -> Dict[str, Any]:
+        async def logout(deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
             """Logout from SMM."""
-            return _handle_smm_operation(smm.logout)
+            return await handle(smm.logout, deadline_seconds=deadline_seconds)
 
     # ============================================================================
     # Phase 1: High Priority New Tools
@@ -628,45 +1184,78 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
 
     # Alert Management Completion
     @app.tool()
-    async def disable_alert_policy(policy_id: str) -> Dict[str, Any]:
+    async def disable_alert_policy(
+        policy_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Disable an alert policy."""
-        return _handle_smm_operation(smm.disable_alert_policy, policy_id)
+        return await handle(
+            smm.disable_alert_policy, policy_id, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def enable_alert_policy(policy_id: str) -> Dict[str, Any]:
+    async def enable_alert_policy(
+        policy_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Enable an alert policy."""
-        return _handle_smm_operation(smm.enable_alert_policy, policy_id)
+        return await handle(
+            smm.enable_alert_policy, policy_id, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_alert_policy_automata(policy_id: str) -> Dict[str, Any]:
+    async def get_alert_policy_automata(
+        policy_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get alert policy automata details."""
-        return _handle_smm_operation(smm.get_alert_policy_automata, policy_id)
+        return await handle(
+            smm.get_alert_policy_automata, policy_id, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_alert_notifications_by_entity(entity_type: str, entity_id: str) -> Dict[str, Any]:
+    async def get_alert_notifications_by_entity(
+        entity_type: str, entity_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get alert notifications by entity type and ID."""
-        return _handle_smm_operation(smm.get_alert_notifications_by_entity, entity_type, entity_id)
+        return await handle(
+            smm.get_alert_notifications_by_entity,
+            entity_type,
+            entity_id,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def mark_alert_notifications_read(notification_ids: List[str]) -> Dict[str, Any]:
+    async def mark_alert_notifications_read(
+        notification_ids: List[str], deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Mark alert notifications as read."""
-        return _handle_smm_operation(smm.mark_alert_notifications_read, notification_ids)
+        return await handle(
+            smm.mark_alert_notifications_read,
+            notification_ids,
+            deadline_seconds=deadline_seconds,
+        )
 
     # Notifiers Management
     @app.tool()
-    async def get_notifiers() -> Dict[str, Any]:
+    async def get_notifiers(deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
         """Get all notifiers."""
-        return _handle_smm_operation(smm.get_notifiers)
+        return await handle(smm.get_notifiers, deadline_seconds=deadline_seconds)
 
     @app.tool()
-    async def get_notifier(notifier_id: str) -> Dict[str, Any]:
+    async def get_notifier(
+        notifier_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get specific notifier details."""
-        return _handle_smm_operation(smm.get_notifier, notifier_id)
+        return await handle(
+            smm.get_notifier, notifier_id, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_notifier_provider_configs() -> Dict[str, Any]:
+    async def get_notifier_provider_configs(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get notifier provider configurations."""
-        return _handle_smm_operation(smm.get_notifier_provider_configs)
+        return await handle(
+            smm.get_notifier_provider_configs, deadline_seconds=deadline_seconds
+        )
 
     # End-to-End Latency Monitoring
     @app.tool()
@@ -674,10 +1263,17 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         topic_name: str, 
         duration: Optional[str] = None, 
         from_time: Optional[str] = None, 
-        to_time: Optional[str] = None
+        to_time: Optional[str] = None, deadline_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """Get end-to-end latency for a topic."""
-        return _handle_smm_operation(smm.get_topic_etelatency, topic_name, duration, from_time, to_time)
+        return await handle(
+            smm.get_topic_etelatency,
+            topic_name,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
     async def get_topic_group_etelatency(
@@ -685,118 +1281,275 @@ def create_server(smm: SMMClient, readonly: bool) -> FastMCP:
         group_name: str, 
         duration: Optional[str] = None, 
         from_time: Optional[str] = None, 
-        to_time: Optional[str] = None
+        to_time: Optional[str] = None, deadline_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """Get end-to-end latency for topic and consumer group."""
-        return _handle_smm_operation(smm.get_topic_group_etelatency, topic_name, group_name, duration, from_time, to_time)
+        return await handle(
+            smm.get_topic_group_etelatency,
+            topic_name,
+            group_name,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
+        )
 
     # Replication Statistics
     @app.tool()
-    async def get_replication_stats() -> Dict[str, Any]:
+    async def get_replication_stats(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get replication statistics."""
-        return _handle_smm_operation(smm.get_replication_stats)
+        return await handle(
+            smm.get_replication_stats, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def is_replication_configured() -> Dict[str, Any]:
+    async def is_replication_configured(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Check if replication is configured."""
-        return _handle_smm_operation(smm.is_replication_configured)
+        return await handle(
+            smm.is_replication_configured, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_replication_stats_by_cluster(source: str, target: str) -> Dict[str, Any]:
+    async def get_replication_stats_by_cluster(
+        source: str, target: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get replication stats by source and target clusters."""
-        return _handle_smm_operation(smm.get_replication_stats_by_cluster, source, target)
+        return await handle(
+            smm.get_replication_stats_by_cluster,
+            source,
+            target,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_topic_replication_stats(source: str, target: str, topic_name: str) -> Dict[str, Any]:
+    async def get_topic_replication_stats(
+        source: str,
+        target: str,
+        topic_name: str,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Get replication stats for specific topic."""
-        return _handle_smm_operation(smm.get_topic_replication_stats, source, target, topic_name)
+        return await handle(
+            smm.get_topic_replication_stats,
+            source,
+            target,
+            topic_name,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_topic_replication_stats_simple(topic_name: str) -> Dict[str, Any]:
+    async def get_topic_replication_stats_simple(
+        topic_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get simple replication stats for topic."""
-        return _handle_smm_operation(smm.get_topic_replication_stats_simple, topic_name)
+        return await handle(
+            smm.get_topic_replication_stats_simple,
+            topic_name,
+            deadline_seconds=deadline_seconds,
+        )
 
     # Kafka Connect Enhancements
     @app.tool()
-    async def get_connector_templates() -> Dict[str, Any]:
+    async def get_connector_templates(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get available connector templates."""
-        return _handle_smm_operation(smm.get_connector_templates)
+        return await handle(
+            smm.get_connector_templates, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_connector_config_definitions(connector_plugin_class: str) -> Dict[str, Any]:
+    async def get_connector_config_definitions(
+        connector_plugin_class: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get connector configuration definitions."""
-        return _handle_smm_operation(smm.get_connector_config_definitions, connector_plugin_class)
+        return await handle(
+            smm.get_connector_config_definitions,
+            connector_plugin_class,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def get_connector_config_sample(name: str, connector_plugin_class: str, version: str) -> Dict[str, Any]:
+    async def get_connector_config_sample(
+        name: str,
+        connector_plugin_class: str,
+        version: str,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Get sample connector configuration."""
-        return _handle_smm_operation(smm.get_connector_config_sample, name, connector_plugin_class, version)
+        return await handle(
+            smm.get_connector_config_sample,
+            name,
+            connector_plugin_class,
+            version,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def validate_connector_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    async def validate_connector_config(
+        config: Dict[str, Any], deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Validate connector configuration."""
-        return _handle_smm_operation(smm.validate_connector_config, config)
+        return await handle(
+            smm.validate_connector_config, config, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def perform_connector_action(connector_name: str, action: str) -> Dict[str, Any]:
+    async def perform_connector_action(
+        connector_name: str, action: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Perform connector actions (start, stop, restart, etc.)."""
-        return _handle_smm_operation(smm.perform_connector_action, connector_name, action)
+        return await handle(
+            smm.perform_connector_action,
+            connector_name,
+            action,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
-    async def is_connect_configured() -> Dict[str, Any]:
+    async def is_connect_configured(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Check if Kafka Connect is configured."""
-        return _handle_smm_operation(smm.is_connect_configured)
+        return await handle(
+            smm.is_connect_configured, deadline_seconds=deadline_seconds
+        )
 
     @app.tool()
-    async def get_connector_sink_metrics(connector_name: str) -> Dict[str, Any]:
+    async def get_connector_sink_metrics(
+        connector_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get connector sink metrics."""
-        return _handle_smm_operation(smm.get_connector_sink_metrics, connector_name)
+        return await handle(
+            smm.get_connector_sink_metrics,
+            connector_name,
+            deadline_seconds=deadline_seconds,
+        )
 
     @app.tool()
     async def get_connect_worker_metrics(
         duration: Optional[str] = None, 
         from_time: Optional[str] = None, 
-        to_time: Optional[str] = None
+        to_time: Optional[str] = None, deadline_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """Get Kafka Connect worker metrics."""
-        return _handle_smm_operation(smm.get_connect_worker_metrics, duration, from_time, to_time)
+        return await handle(
+            smm.get_connect_worker_metrics,
+            duration,
+            from_time,
+            to_time,
+            deadline_seconds=deadline_seconds,
+        )
 
     # Additional working endpoints discovered through API exploration
     @app.tool()
-    async def get_admin_cluster() -> Dict[str, Any]:
-        """Get admin cluster information with detailed broker and controller data."""
-        return _handle_smm_operation(smm.get_admin_cluster)
+    async def get_admin_cluster(
+        fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get admin cluster information with detailed broker and controller data. May be served from a recent snapshot; data_age_seconds reports its age. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_admin_cluster,
+            fresh=fresh,
+            report_age=True,
+            deadline_seconds=deadline_seconds,
+        )
     
     @app.tool()
-    async def get_admin_brokers() -> Dict[str, Any]:
+    async def get_admin_brokers(
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get admin brokers information with detailed broker data."""
-        return _handle_smm_operation(smm.get_admin_brokers)
+        return await handle(smm.get_admin_brokers, deadline_seconds=deadline_seconds)
     
     @app.tool()
-    async def get_admin_topics() -> Dict[str, Any]:
-        """Get admin topics information with detailed topic and partition data."""
-        return _handle_smm_operation(smm.get_admin_topics)
+    async def get_admin_topics(
+        fields: Optional[List[str]] = None,
+        fresh: bool = False,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get admin topics information with detailed topic and partition data. Pass fields to return only those keys of each topic. May be served from a recent snapshot; data_age_seconds reports its age. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_admin_topics,
+            fields,
+            fresh=fresh,
+            report_age=True,
+            deadline_seconds=deadline_seconds,
+        )
     
     @app.tool()
-    async def get_admin_topic_details(topic_name: str) -> Dict[str, Any]:
-        """Get admin topic details for a specific topic."""
-        return _handle_smm_operation(smm.get_admin_topic_details, topic_name)
+    async def get_admin_topic_details(
+        topic_name: str, fresh: bool = False, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get admin topic details for a specific topic. Set fresh=True to bypass the response cache."""
+        return await handle(
+            smm.get_admin_topic_details,
+            topic_name,
+            fresh=fresh,
+            deadline_seconds=deadline_seconds,
+        )
     
     @app.tool()
-    async def get_admin_topic_partitions(topic_name: str) -> Dict[str, Any]:
+    async def get_admin_topic_partitions(
+        topic_name: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get admin topic partitions for a specific topic."""
-        return _handle_smm_operation(smm.get_admin_topic_partitions, topic_name)
+        return await handle(
+            smm.get_admin_topic_partitions,
+            topic_name,
+            deadline_seconds=deadline_seconds,
+        )
 
     return app
 
 
+def _start_capability_probe(smm: Union[SMMClient, AsyncSMMClient]) -> asyncio.Future:
+    """Probe endpoint capabilities in the background so startup is not delayed."""
+    if isinstance(smm, AsyncSMMClient):
+        probe = asyncio.ensure_future(smm.probe_capabilities(False))
+    else:
+        probe = asyncio.get_running_loop().run_in_executor(
+            None, smm.probe_capabilities, False
+        )
+    # A failed probe leaves requests unrouted; nothing to report at startup
+    probe.add_done_callback(lambda f: f.cancelled() or f.exception())
+    return probe
+
+
+async def _shutdown(
+    smm: Union[SMMClient, AsyncSMMClient], worker_pool: Optional[WorkerPool]
+) -> None:
+    """Release the HTTP connections and worker threads the server opened."""
+    if worker_pool is not None:
+        worker_pool.shutdown()
+    if isinstance(smm, AsyncSMMClient):
+        await smm.aclose()
+
+
 async def run_stdio() -> None:
     # For FastMCP, prefer the built-in stdio runner
     config = ServerConfig()
     smm = build_client(config)
-    server = create_server(smm, readonly=config.readonly)
+    worker_pool = build_worker_pool(config)
+    server = create_server(
+        smm,
+        readonly=config.readonly,
+        worker_pool=worker_pool,
+        deadlines=config.build_deadlines(),
+    )
+    probe = None
+    if config.capability_probe and not smm.capabilities.is_fresh():
+        probe = _start_capability_probe(smm)
     # run() is synchronous; call the async flavor directly
-    await server.run_stdio_async()
+    try:
+        await server.run_stdio_async()
+    finally:
+        if probe is not None:
+            probe.cancel()
+        await _shutdown(smm, worker_pool)
 
 
 def main() -> None:
@@ -805,8 +1558,18 @@ def main() -> None:
         # Defer to FastMCP synchronous run helper for other transports when added
         config = ServerConfig()
         smm = build_client(config)
-        server = create_server(smm, readonly=config.readonly)
-        server.run(transport=transport)
+        worker_pool = build_worker_pool(config)
+        server = create_server(
+            smm,
+            readonly=config.readonly,
+            worker_pool=worker_pool,
+            deadlines=config.build_deadlines(),
+        )
+        try:
+            server.run(transport=transport)
+        finally:
+            # run() owned its event loop; close the async client on a fresh one
+            anyio.run(_shutdown, smm, worker_pool)
         return
     anyio.run(run_stdio)
 
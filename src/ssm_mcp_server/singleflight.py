@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from .cancel import CallCancelled, check_cancelled, wait_slice
+from .deadline import DeadlineExceeded, check_deadline
+
+
+def request_key(path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, ...]:
+    """Key identifying a GET by path and (order-insensitive) query params."""
+    if not params:
+        return (path.lstrip("/"),)
+    return (path.lstrip("/"),) + tuple(
+        sorted((k, str(v)) for k, v in params.items())
+    )
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Share one in-flight execution between concurrent callers of the same key.
+
+    Threads use ``do``; asyncio tasks use ``do_async``. Followers receive the
+    leader's result (the same decoded object) or re-raise its exception. Each
+    caller waits only until its own deadline, and a leader that ran out of
+    time or was cancelled doesn't fail followers that still have time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+        if not leader:
+            # Wait in slices so a cancelled or late follower gives its thread back
+            while not call.done.wait(
+                wait_slice(check_deadline("waiting for a coalesced request"))
+            ):
+                check_cancelled()
+            if isinstance(call.error, (CallCancelled, DeadlineExceeded)):
+                # The leader's caller went away or ran out of time, not ours;
+                # make the call ourselves within our own budget
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                # No caller's deadline applies to the shared call; each caller
+                # bounds its own wait below
+                task = self._tasks[key] = contextvars.Context().run(
+                    asyncio.get_running_loop().create_task, fn()
+                )
+                task.add_done_callback(lambda _t: self._forget(key, _t))
+                self._executed += 1
+            else:
+                self._coalesced += 1
+            self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield so one caller being cancelled does not cancel the shared call
+            left = check_deadline("waiting for a coalesced request")
+            if left is None:
+                return await asyncio.shield(task)
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), timeout=left)
+            except asyncio.TimeoutError:
+                if task.done():
+                    raise  # the shared call itself timed out
+                raise DeadlineExceeded("waiting for a coalesced request") from None
+        finally:
+            with self._lock:
+                waiting = self._waiters.pop(task) - 1
+                if waiting:
+                    self._waiters[task] = waiting
+            if not waiting and not task.done():
+                # Every caller was cancelled; stop the request instead of finishing it
+                task.cancel()
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every waiter has gone away
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import ijson
+except ImportError:  # optional: pip install 'ssm-mcp-server[streaming]'
+    ijson = None
+
+_STARTS = frozenset({"start_map", "start_array"})
+_ENDS = frozenset({"end_map", "end_array"})
+
+
+def streaming_available() -> bool:
+    return ijson is not None
+
+
+def project(value: Any, fields: Sequence[str]) -> Any:
+    """Keep only ``fields`` of a map; other values pass through unchanged."""
+    if not isinstance(value, dict):
+        return value
+    return {k: value[k] for k in fields if k in value}
+
+
+def project_document(document: Any, fields: Sequence[str]) -> Any:
+    """Project every item of a list document, or the keys of a map document."""
+    if isinstance(document, list):
+        return [project(item, fields) for item in document]
+    return project(document, fields)
+
+
+def fields_key(fields: Sequence[str]) -> Tuple[Any, ...]:
+    """Suffix for a request key so projections are cached apart from full bodies."""
+    return (("__fields__", ",".join(sorted(set(fields)))),)
+
+
+class _Projector:
+    """Builds a projected document from ijson events.
+
+    Only the values of wanted keys are materialised; everything else is
+    parsed and dropped, so memory stays proportional to the projection.
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        self.wanted = set(fields)
+        self.result: Any = None
+        self._depth = 0
+        self._key_depth = 1
+        self._current: Optional[dict] = None
+        self._key: Optional[str] = None
+        self._after_key = False
+        self._builder: Any = None
+        self._store: Any = None
+        self._nested = 0
+
+    def feed(self, event: str, value: Any) -> None:
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if event in _STARTS:
+                self._nested += 1
+            elif event in _ENDS:
+                self._nested -= 1
+            if self._nested == 0:
+                self._store(self._builder.value)
+                self._builder = None
+            return
+
+        if self._depth == 0:
+            if event == "start_array":
+                self.result = []
+                self._key_depth = 2
+            elif event == "start_map":
+                self.result = self._current = {}
+                self._key_depth = 1
+            else:
+                self.result = value
+                return
+            self._depth = 1
+            return
+
+        if self._after_key:
+            self._after_key = False
+            if self._key in self.wanted:
+                self._capture(event, value, self._current.__setitem__, self._key)
+                return
+        elif self._depth == 1 and isinstance(self.result, list):
+            # An item of a list document
+            if event == "start_map":
+                self._current = {}
+                self.result.append(self._current)
+            elif event == "start_array":
+                self._capture(event, value, lambda _k, v: self.result.append(v), None)
+                return
+            elif event not in _ENDS:
+                self.result.append(value)
+                return
+        elif event == "map_key" and self._depth == self._key_depth:
+            self._key = value
+            self._after_key = True
+            return
+
+        if event in _STARTS:
+            self._depth += 1
+        elif event in _ENDS:
+            self._depth -= 1
+
+    def _capture(self, event: str, value: Any, store: Any, key: Optional[str]) -> None:
+        if event not in _STARTS:
+            store(key, value)
+            return
+        self._builder = ijson.ObjectBuilder()
+        self._builder.event(event, value)
+        self._nested = 1
+        self._store = lambda v: store(key, v)
+
+
+def stream_project(source: Any, fields: Sequence[str]) -> Any:
+    """Decode a JSON body from a file-like ``source`` keeping only ``fields``."""
+    if ijson is None:
+        return project_document(json.load(source), fields)
+    projector = _Projector(fields)
+    for _prefix, event, value in ijson.parse(source, use_float=True):
+        projector.feed(event, value)
+    return projector.result
+
+
+class _AsyncReader:
+    """Adapts an async byte iterator to the ``read(n)`` interface ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                break
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+async def stream_project_async(chunks: AsyncIterator[bytes], fields: Sequence[str]) -> Any:
+    """Async counterpart of stream_project over decoded body chunks."""
+    if ijson is None:
+        body: List[bytes] = [chunk async for chunk in chunks]
+        return project_document(json.loads(b"".join(body)), fields)
+    projector = _Projector(fields)
+    async for _prefix, event, value in ijson.parse_async(_AsyncReader(chunks), use_float=True):
+        projector.feed(event, value)
+    return projector.result
+
+
+def normalize_fields(fields: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """Clean a tool's ``fields`` argument; None or empty means the full document."""
+    if not fields:
+        return None
+    cleaned = [f.strip() for f in fields if f and f.strip()]
+    return cleaned or None
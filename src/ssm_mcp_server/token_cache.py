@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import stat
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: entries are still shared, just not locked
+    fcntl = None
+
+
+def jwt_expiry(token: Optional[str]) -> Optional[float]:
+    """Unix time from a JWT's (unverified) ``exp`` claim, or None if it has none."""
+    if not token or token.count(".") != 2:
+        return None
+    payload = token.split(".")[1]
+    padded = payload + "=" * (-len(payload) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+        return float(claims["exp"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def cache_key(gateway_url: str, user: Optional[str], passcode: Optional[str]) -> str:
+    """Key of a gateway/identity pair; a passcode is only stored as a digest."""
+    identity = user or ""
+    if not user and passcode:
+        identity = "passcode:" + hashlib.sha256(passcode.encode()).hexdigest()[:16]
+    return f"{gateway_url.rstrip('/')}|{identity}"
+
+
+class TokenCache:
+    """Knox JWTs shared by the server processes of one user, in a 0600 JSON file.
+
+    Reads and writes hold an exclusive lock on ``<path>.lock``, and a process
+    that finds no usable token mints one while still holding it, so processes
+    starting together do a single Knox exchange. A file that other users
+    could read or write is ignored.
+    """
+
+    def __init__(self, path: str, min_validity: float = 60.0):
+        self.path = os.path.expanduser(path)
+        # Cached tokens expiring sooner than this are replaced, not reused
+        self.min_validity = min_validity
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                info = os.fstat(f.fileno())
+                if info.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                    return {}
+                if hasattr(os, "getuid") and info.st_uid != os.getuid():
+                    return {}
+                document = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return document if isinstance(document, dict) else {}
+
+    def _write(self, document: Dict[str, Any]) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _usable(self, token: Any) -> bool:
+        expires_at = jwt_expiry(token) if isinstance(token, str) else None
+        return expires_at is not None and expires_at - time.time() > self.min_validity
+
+    def get_or_mint(
+        self, key: str, mint: Callable[[], str], stale: Optional[str] = None
+    ) -> str:
+        """The cached token for ``key`` if still valid and not ``stale``, else a new one."""
+        with self._locked():
+            document = self._read()
+            token = document.get(key)
+            if token != stale and self._usable(token):
+                return token
+            token = mint()
+            # Purge expired entries while rewriting the file
+            document = {k: v for k, v in document.items() if self._usable(v)}
+            if jwt_expiry(token) is not None:
+                document[key] = token
+            self._write(document)
+            return token
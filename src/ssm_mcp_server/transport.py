@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cancel import CancellableHTTPConnectionPool, CancellableHTTPSConnectionPool
+
+# Codings both requests (urllib3) and httpx decode without optional packages
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+class PoolSettings(NamedTuple):
+    """Connection pool and wire settings shared by the requests and httpx transports."""
+
+    # Distinct hosts with a pool of their own (requests only)
+    connections: int = 10
+    # Connections kept per host; size it to the peak number of parallel calls
+    maxsize: int = 64
+    # Wait for a free connection instead of opening a throwaway one
+    block: bool = False
+    keepalive: bool = True
+    # Idle seconds before a kept-alive connection is closed (httpx only)
+    keepalive_expiry: float = 60.0
+    # Ask SMM for gzip/deflate bodies; large topic and metric listings compress ~10x
+    compression: bool = True
+
+
+class CancellableAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections a cancelled tool call can shut down."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CancellableHTTPConnectionPool,
+            "https": CancellableHTTPSConnectionPool,
+        }
+
+
+def configure_session(session: requests.Session, pool: PoolSettings) -> requests.Session:
+    """Mount pooled adapters sized by ``pool`` on both schemes."""
+    # Retries are handled by RetryPolicy, so urllib3 must not retry on its own
+    adapter = CancellableAdapter(
+        pool_connections=pool.connections,
+        pool_maxsize=pool.maxsize,
+        pool_block=pool.block,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not pool.keepalive:
+        session.headers["Connection"] = "close"
+    # Set explicitly: the async client copies the session headers per request
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING if pool.compression else "identity"
+    return session
+
+
+def httpx_limits(pool: PoolSettings) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=pool.maxsize if pool.block else None,
+        max_keepalive_connections=pool.maxsize if pool.keepalive else 0,
+        keepalive_expiry=pool.keepalive_expiry,
+    )